@@ -36,6 +36,10 @@ CREATE TABLE IF NOT EXISTS posters (
     version INTEGER DEFAULT 1,
     is_latest INTEGER DEFAULT 1,
     raw_json TEXT,
+    event_count INTEGER NOT NULL DEFAULT 0,
+    pending_count INTEGER NOT NULL DEFAULT 0,
+    approved_count INTEGER NOT NULL DEFAULT 0,
+    rejected_count INTEGER NOT NULL DEFAULT 0,
     extracted_at TEXT DEFAULT CURRENT_TIMESTAMP,
     created_at TEXT DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (artist_id) REFERENCES artists(id) ON DELETE CASCADE
@@ -47,6 +51,8 @@ CREATE INDEX IF NOT EXISTS idx_posters_latest ON posters (artist_id, source_mont
 CREATE INDEX IF NOT EXISTS idx_posters_source_url ON posters (source_url);
 CREATE INDEX IF NOT EXISTS idx_posters_source_post_id ON posters (source_post_id);
 CREATE INDEX IF NOT EXISTS idx_posters_extraction_status ON posters (extraction_status);
+CREATE INDEX IF NOT EXISTS idx_posters_created ON posters (created_at);
+CREATE INDEX IF NOT EXISTS idx_posters_image_hash ON posters (image_hash);
 
 CREATE TABLE IF NOT EXISTS events (
     id TEXT PRIMARY KEY,
@@ -77,3 +83,54 @@ CREATE INDEX IF NOT EXISTS idx_events_city ON events (city);
 CREATE INDEX IF NOT EXISTS idx_events_province ON events (province);
 CREATE INDEX IF NOT EXISTS idx_events_status ON events (status);
 CREATE INDEX IF NOT EXISTS idx_events_review_status ON events (review_status);
+CREATE INDEX IF NOT EXISTS idx_events_poster_date ON events (poster_id, date, id);
+CREATE INDEX IF NOT EXISTS idx_events_poster_review ON events (poster_id, review_status, date, id);
+
+-- Keep the per-poster event counters on posters in sync with events.
+CREATE TRIGGER IF NOT EXISTS trg_events_counts_insert
+AFTER INSERT ON events
+BEGIN
+    UPDATE posters SET
+        event_count = event_count + 1,
+        pending_count = pending_count + (NEW.review_status IS 'pending'),
+        approved_count = approved_count + (NEW.review_status IS 'approved'),
+        rejected_count = rejected_count + (NEW.review_status IS 'rejected')
+    WHERE id = NEW.poster_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_events_counts_delete
+AFTER DELETE ON events
+BEGIN
+    UPDATE posters SET
+        event_count = event_count - 1,
+        pending_count = pending_count - (OLD.review_status IS 'pending'),
+        approved_count = approved_count - (OLD.review_status IS 'approved'),
+        rejected_count = rejected_count - (OLD.review_status IS 'rejected')
+    WHERE id = OLD.poster_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_events_counts_update
+AFTER UPDATE OF poster_id, review_status ON events
+BEGIN
+    UPDATE posters SET
+        event_count = event_count - 1,
+        pending_count = pending_count - (OLD.review_status IS 'pending'),
+        approved_count = approved_count - (OLD.review_status IS 'approved'),
+        rejected_count = rejected_count - (OLD.review_status IS 'rejected')
+    WHERE id = OLD.poster_id;
+    UPDATE posters SET
+        event_count = event_count + 1,
+        pending_count = pending_count + (NEW.review_status IS 'pending'),
+        approved_count = approved_count + (NEW.review_status IS 'approved'),
+        rejected_count = rejected_count + (NEW.review_status IS 'rejected')
+    WHERE id = NEW.poster_id;
+END;
+
+CREATE TABLE IF NOT EXISTS ingest_log (
+    path TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    poster_id TEXT NOT NULL,
+    summary_json TEXT NOT NULL,
+    ingested_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (poster_id) REFERENCES posters(id) ON DELETE CASCADE
+);
@@ -1,20 +1,42 @@
 #!/usr/bin/env python3
 import argparse
-import json
+import hashlib
 from pathlib import Path
 import sys
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
+SRC_DIR = str(PROJECT_ROOT / "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
-from local_db import ingest_structured
+SOURCE_TYPES = frozenset({"manual", "instagram", "facebook", "website"})
+
+
+def _source_type(value: str) -> str:
+    if value not in SOURCE_TYPES:
+        raise argparse.ArgumentTypeError(
+            f"invalid source type {value!r} (choose from {', '.join(sorted(SOURCE_TYPES))})"
+        )
+    return value
+
+
+def _content_hash(raw: bytes, args: argparse.Namespace) -> str:
+    digest = hashlib.sha256(raw)
+    for value in (args.image_url, args.source_type, args.source_url):
+        digest.update(b"\0" + (value or "").encode("utf-8"))
+    return digest.hexdigest()
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Ingest structured tour JSON into a local SQLite database."
     )
-    parser.add_argument("input", help="Path to structured JSON file.")
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        metavar="input",
+        help="Path to structured JSON file(s).",
+    )
     parser.add_argument(
         "--db",
         default=str(PROJECT_ROOT / "output" / "local.db"),
@@ -22,29 +44,73 @@ def main() -> None:
     )
     parser.add_argument(
         "--image-url",
-        help="Poster image URL or local path.",
+        help="Poster image URL or local path (single input only).",
     )
     parser.add_argument(
         "--source-type",
         default="manual",
-        choices=["manual", "instagram", "facebook", "website"],
-        help="Source type for the poster.",
+        type=_source_type,
+        help="Source type for the poster (manual, instagram, facebook, website).",
     )
     parser.add_argument(
         "--source-url",
-        help="Original source URL (Instagram post, etc.).",
+        help="Original source URL (Instagram post, etc.; single input only).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-ingest inputs even if they were already ingested unchanged.",
+    )
+    output_format = parser.add_mutually_exclusive_group()
+    output_format.add_argument(
+        "--pretty",
+        dest="pretty",
+        action="store_true",
+        default=None,
+        help="Indent the JSON summary (default when stdout is a terminal).",
+    )
+    output_format.add_argument(
+        "--compact",
+        dest="pretty",
+        action="store_false",
+        help="Emit the JSON summary on one line (default when piped).",
     )
     args = parser.parse_args()
+    if len(args.inputs) > 1 and (args.image_url or args.source_url):
+        parser.error("--image-url and --source-url apply to a single input file.")
 
-    data = json.loads(Path(args.input).read_text(encoding="utf-8"))
-    summary = ingest_structured(
-        data,
-        db_path=Path(args.db),
-        image_url=args.image_url,
-        source_type=args.source_type,
-        source_url=args.source_url,
-    )
-    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    # Deferred so --help and argument errors never load the DB layer.
+    from local_db import find_ingest, ingest_structured, init_db, json_dumps, json_loads, record_ingest
+
+    db_path = Path(args.db)
+    conn = init_db(db_path)
+    summaries = []
+    try:
+        for input_path in args.inputs:
+            log_path = str(Path(input_path).resolve())
+            raw = Path(input_path).read_bytes()
+            content_hash = _content_hash(raw, args)
+            cached = None if args.force else find_ingest(conn, log_path, content_hash)
+            if cached:
+                summaries.append({**cached, "skipped": True})
+                continue
+            summary = ingest_structured(
+                json_loads(raw),
+                db_path=db_path,
+                image_url=args.image_url,
+                source_type=args.source_type,
+                source_url=args.source_url,
+                conn=conn,
+            )
+            record_ingest(conn, log_path, content_hash, summary)
+            summaries.append(summary)
+    finally:
+        conn.close()
+
+    output = summaries[0] if len(summaries) == 1 else summaries
+    pretty = sys.stdout.isatty() if args.pretty is None else args.pretty
+    sys.stdout.buffer.write(json_dumps(output, pretty) + b"\n")
+    sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
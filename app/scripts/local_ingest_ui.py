@@ -1,34 +1,95 @@
 #!/usr/bin/env python3
+import atexit
+import gzip
 import hashlib
 import html
 import json
 import re
 import mimetypes
+import mmap
 import os
 import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from urllib.parse import urlparse
 from datetime import datetime
 from pathlib import Path
 import sys
 
-from flask import Flask, request, send_from_directory, redirect
+from flask import Flask, Request, Response, abort, request, send_from_directory, redirect
 import requests
+from requests.adapters import HTTPAdapter
+from werkzeug.security import safe_join
 from werkzeug.utils import secure_filename
 
+try:
+    from flask_compress import Compress
+except ImportError:  # flask-compress is optional; pages are then sent uncompressed.
+    Compress = None
+
+try:
+    from waitress import serve
+except ImportError:  # waitress is optional; __main__ then falls back to the Werkzeug server.
+    serve = None
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
+SRC_DIR = str(PROJECT_ROOT / "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
 from image_to_structured import image_to_structured
 from local_db import ingest_structured, init_db
 
 
-app = Flask(__name__)
+# Read once at import, while single-threaded; os.umask can only be queried by setting it.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+# Spool uploaded files straight into UPLOAD_DIR so saving them is a rename, not a copy.
+class UploadRequest(Request):
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        if not filename:
+            return super()._get_file_stream(total_content_length, content_type, filename, content_length)
+        UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+        stream = tempfile.NamedTemporaryFile("wb+", dir=UPLOAD_DIR, prefix=".upload_", delete=False)
+        self.__dict__.setdefault("upload_spool_paths", []).append(stream.name)
+        return stream
+
+
+app = Flask(__name__, static_folder=None)
+app.request_class = UploadRequest
 app.config["MAX_CONTENT_LENGTH"] = 20 * 1024 * 1024
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 24 * 60 * 60
+app.config["COMPRESS_MIN_SIZE"] = 1024
+app.config["COMPRESS_LEVEL"] = 6
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+if Compress is not None:
+    Compress(app)
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+STATIC_MAX_AGE = 365 * 24 * 60 * 60
 
 UPLOAD_DIR = PROJECT_ROOT / "output" / "uploads"
 DB_PATH = Path(os.getenv("LOCAL_DB_PATH", PROJECT_ROOT / "output" / "local.db"))
 KEEP_REMOTE_DOWNLOADS = os.getenv("KEEP_REMOTE_DOWNLOADS", "0") == "1"
 REMOTE_CACHE_MAX_FILES = int(os.getenv("REMOTE_CACHE_MAX_FILES", "200"))
+USE_XACCEL = os.getenv("USE_XACCEL", "0") == "1"
+XACCEL_UPLOAD_PREFIX = os.getenv("XACCEL_UPLOAD_PREFIX", "/_protected/uploads/")
+INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", "2"))
+SERVER_THREADS = int(os.getenv("SERVER_THREADS", "8"))
+DEV_SERVER = os.getenv("DEV_SERVER", "0") == "1"
+INGEST_JOBS_MAX = 200
+IO_CHUNK_SIZE = 1 << 20
+HASH_MMAP_MIN_SIZE = 4 << 20
+UPLOAD_INDEX_TTL = 5.0
+POSTERS_CACHE_TTL = 2.0
 
 
 def _ensure_db() -> None:
@@ -42,677 +103,73 @@ def _ensure_db() -> None:
 
 _ensure_db()
 
+_DB_LOCAL = threading.local()
+_DB_CONNECTIONS: list[sqlite3.Connection] = []
+_DB_CONNECTIONS_LOCK = threading.Lock()
+
+
+def _db() -> sqlite3.Connection:
+    conn = getattr(_DB_LOCAL, "conn", None)
+    if conn is None:
+        # Writers open their own BEGIN IMMEDIATE, so skip the module's implicit transactions.
+        conn = sqlite3.connect(str(DB_PATH), check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA cache_size = -20000")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        _DB_LOCAL.conn = conn
+        with _DB_CONNECTIONS_LOCK:
+            _DB_CONNECTIONS.append(conn)
+    return conn
+
+
+@contextmanager
+def _db_write():
+    conn = _db()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+    _invalidate_posters_cache()
+
+
+@atexit.register
+def _close_db_connections() -> None:
+    with _DB_CONNECTIONS_LOCK:
+        while _DB_CONNECTIONS:
+            _DB_CONNECTIONS.pop().close()
+
 
-def _render_page(body: str, title: str = "Artist Calendar") -> str:
-    return f"""<!doctype html>
+def _asset_version() -> str:
+    digest = hashlib.sha256()
+    for name in ("app.css", "app.js"):
+        digest.update((STATIC_DIR / name).read_bytes())
+    return digest.hexdigest()[:12]
+
+
+ASSET_VERSION = _asset_version()
+
+_PAGE_HEAD = """<!doctype html>
 <html lang="en">
   <head>
     <meta charset="utf-8">
     <meta name="viewport" content="width=device-width, initial-scale=1">
-    <title>{title}</title>
-    <style>
-      @import url("https://fonts.googleapis.com/css2?family=Fraunces:wght@600;700&family=Space+Grotesk:wght@400;500;600&display=swap");
-      :root {{
-        --bg: #f6f1ea;
-        --bg-2: #fbe8d1;
-        --surface: #fffaf3;
-        --ink: #1f1a17;
-        --muted: #6d625a;
-        --accent: #1c7c7b;
-        --accent-2: #e26d5c;
-        --accent-3: #f2c14e;
-        --border: #e6dbcf;
-        --shadow: 0 18px 40px rgba(60, 40, 20, 0.12);
-      }}
-      * {{ box-sizing: border-box; }}
-      body {{
-        margin: 0;
-        font-family: "Space Grotesk", sans-serif;
-        color: var(--ink);
-        background:
-          radial-gradient(1200px 420px at 10% -10%, rgba(28, 124, 123, 0.18), transparent 60%),
-          radial-gradient(900px 380px at 90% 0%, rgba(226, 109, 92, 0.18), transparent 60%),
-          linear-gradient(180deg, var(--bg) 0%, #f8f3ed 60%, #f4ede4 100%);
-        min-height: 100vh;
-      }}
-      body.panel-open {{
-        overflow: hidden;
-      }}
-      .container {{
-        max-width: 980px;
-        margin: 0 auto;
-        padding: 28px 20px 60px;
-      }}
-      .topbar {{
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        gap: 16px;
-        margin-bottom: 24px;
-      }}
-      .brand {{
-        display: flex;
-        gap: 12px;
-        align-items: center;
-      }}
-      .logo {{
-        width: 44px;
-        height: 44px;
-        border-radius: 14px;
-        background: linear-gradient(135deg, var(--accent), var(--accent-2));
-        color: white;
-        display: grid;
-        place-items: center;
-        font-weight: 700;
-        font-size: 18px;
-        letter-spacing: 0.5px;
-      }}
-      .brand-title {{
-        font-family: "Fraunces", serif;
-        font-size: 20px;
-      }}
-      .brand-sub {{
-        font-size: 13px;
-        color: var(--muted);
-      }}
-      h1, h2, h3 {{
-        font-family: "Fraunces", serif;
-        margin: 0 0 12px;
-      }}
-      h1 {{
-        font-size: 32px;
-        line-height: 1.1;
-      }}
-      p {{
-        margin: 0 0 12px;
-        color: var(--muted);
-      }}
-      .hero {{
-        display: grid;
-        gap: 20px;
-      }}
-      .card {{
-        background: var(--surface);
-        border: 1px solid var(--border);
-        border-radius: 18px;
-        padding: 20px;
-        box-shadow: var(--shadow);
-      }}
-      .card.tight {{
-        padding: 16px;
-      }}
-      .pill {{
-        display: inline-flex;
-        align-items: center;
-        padding: 4px 10px;
-        border-radius: 999px;
-        font-size: 12px;
-        background: rgba(28, 124, 123, 0.12);
-        color: var(--accent);
-      }}
-      .pill.accent {{
-        background: rgba(226, 109, 92, 0.12);
-        color: var(--accent-2);
-      }}
-      .button {{
-        display: inline-flex;
-        align-items: center;
-        justify-content: center;
-        gap: 8px;
-        padding: 12px 16px;
-        border-radius: 12px;
-        border: none;
-        background: var(--accent);
-        color: white;
-        font-weight: 600;
-        text-decoration: none;
-        cursor: pointer;
-        width: 100%;
-      }}
-      .button.secondary {{
-        background: var(--accent-2);
-      }}
-      .button.small {{
-        padding: 8px 12px;
-        font-size: 12px;
-      }}
-      .button.ghost {{
-        background: transparent;
-        color: var(--accent);
-        border: 1px solid var(--border);
-        width: auto;
-      }}
-      .segmented {{
-        display: flex;
-        background: white;
-        border: 1px solid var(--border);
-        border-radius: 12px;
-        padding: 4px;
-        gap: 4px;
-      }}
-      .mode-switch input[type="radio"] {{
-        display: none;
-      }}
-      .segmented label {{
-        flex: 1;
-        text-align: center;
-        padding: 8px 10px;
-        border-radius: 8px;
-        cursor: pointer;
-        font-weight: 600;
-        color: var(--muted);
-      }}
-      #mode_upload:checked ~ .segmented label[for="mode_upload"],
-      #mode_url:checked ~ .segmented label[for="mode_url"] {{
-        background: var(--accent);
-        color: white;
-      }}
-      .mode-panels .panel {{
-        display: none;
-        margin-top: 14px;
-      }}
-      #mode_upload:checked ~ .mode-panels .panel.upload {{
-        display: block;
-      }}
-      #mode_url:checked ~ .mode-panels .panel.url {{
-        display: block;
-      }}
-      .actions {{
-        display: flex;
-        flex-wrap: wrap;
-        gap: 12px;
-        margin-top: 16px;
-      }}
-      .actions .button {{
-        width: 100%;
-      }}
-      .field {{
-        margin-top: 14px;
-      }}
-      label {{
-        display: block;
-        font-weight: 600;
-        margin-bottom: 6px;
-      }}
-      input, select {{
-        width: 100%;
-        padding: 12px 14px;
-        border-radius: 12px;
-        border: 1px solid var(--border);
-        background: white;
-        font-family: inherit;
-      }}
-      input:focus, select:focus {{
-        outline: 2px solid rgba(28, 124, 123, 0.25);
-        border-color: var(--accent);
-      }}
-      .hint {{
-        font-size: 12px;
-        color: var(--muted);
-        margin-top: 6px;
-      }}
-      .hint.warn {{
-        color: var(--accent-2);
-      }}
-      .or {{
-        text-align: center;
-        margin: 14px 0;
-        color: var(--muted);
-        font-size: 13px;
-        letter-spacing: 0.1em;
-      }}
-      .section-title {{
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        gap: 12px;
-        margin-bottom: 12px;
-      }}
-      .section-title form {{
-        margin: 0;
-      }}
-      .list {{
-        display: grid;
-        gap: 12px;
-      }}
-      .poster-card {{
-        display: grid;
-        grid-template-columns: 64px 1fr;
-        gap: 12px;
-        padding: 12px;
-        border-radius: 14px;
-        border: 1px solid var(--border);
-        background: white;
-        text-decoration: none;
-        color: inherit;
-      }}
-      .poster-thumb {{
-        width: 64px;
-        height: 64px;
-        border-radius: 10px;
-        background: #f0e7dd;
-        overflow: hidden;
-        display: grid;
-        place-items: center;
-        font-size: 12px;
-        color: var(--muted);
-      }}
-      .poster-thumb img {{
-        width: 100%;
-        height: 100%;
-        object-fit: cover;
-      }}
-      .poster-meta h3 {{
-        font-size: 18px;
-        margin-bottom: 4px;
-      }}
-      .meta-row {{
-        display: flex;
-        flex-wrap: wrap;
-        gap: 8px;
-        font-size: 13px;
-        color: var(--muted);
-      }}
-      .event-list {{
-        display: grid;
-        gap: 10px;
-      }}
-      .poster-grid {{
-        display: grid;
-        gap: 20px;
-      }}
-      .poster-stack {{
-        display: grid;
-        gap: 20px;
-      }}
-      .poster-peek {{
-        display: none;
-        margin: 12px 0 16px;
-        padding: 12px;
-        border-radius: 16px;
-        border: 1px solid var(--border);
-        background: #fff3e8;
-      }}
-      .poster-peek-image {{
-        width: 100%;
-        max-height: 180px;
-        object-fit: contain;
-        border-radius: 12px;
-        background: #f0e7dd;
-      }}
-      .poster-image[data-modal-open],
-      .poster-peek-image[data-modal-open] {{
-        cursor: zoom-in;
-      }}
-      .event-panel {{
-        position: relative;
-      }}
-      .event-panel-backdrop {{
-        display: none;
-      }}
-      .event-panel-header {{
-        display: none;
-        align-items: center;
-        justify-content: space-between;
-        gap: 12px;
-        margin-bottom: 12px;
-      }}
-      .event-panel-title {{
-        font-weight: 600;
-      }}
-      .event-card {{
-        display: grid;
-        grid-template-columns: 72px 1fr;
-        gap: 12px;
-        padding: 12px;
-        border-radius: 14px;
-        border: 1px solid var(--border);
-        background: white;
-        cursor: pointer;
-      }}
-      .event-card.active {{
-        border-color: rgba(28, 124, 123, 0.45);
-        background: #f5fbfa;
-      }}
-      .poster-image {{
-        width: 100%;
-        border-radius: 16px;
-        max-height: 520px;
-        object-fit: contain;
-        background: #f0e7dd;
-      }}
-      .poster-image.full {{
-        max-height: 80vh;
-      }}
-      .event-card.focus {{
-        outline: 2px solid rgba(28, 124, 123, 0.4);
-        box-shadow: 0 0 0 4px rgba(28, 124, 123, 0.08);
-        animation: pulse 1.2s ease;
-      }}
-      .event-date {{
-        font-weight: 700;
-        color: var(--accent);
-        text-align: center;
-        background: rgba(28, 124, 123, 0.08);
-        border-radius: 12px;
-        padding: 8px 6px;
-      }}
-      .event-title {{
-        font-weight: 600;
-        margin-bottom: 4px;
-      }}
-      .event-meta {{
-        font-size: 13px;
-        color: var(--muted);
-      }}
-      .event-meta.missing {{
-        color: var(--accent-2);
-      }}
-      .event-card.has-missing {{
-        border-color: rgba(226, 109, 92, 0.28);
-        background: #fff9f6;
-      }}
-      .event-detail.empty {{
-        display: grid;
-        place-items: center;
-        text-align: center;
-        color: var(--muted);
-      }}
-      .missing-chips {{
-        display: flex;
-        flex-wrap: wrap;
-        gap: 6px;
-        margin-top: 6px;
-      }}
-      .chip {{
-        display: inline-flex;
-        align-items: center;
-        padding: 2px 8px;
-        border-radius: 999px;
-        font-size: 11px;
-        background: #f1e9df;
-        color: var(--muted);
-      }}
-      .chip.warn {{
-        background: rgba(226, 109, 92, 0.14);
-        color: var(--accent-2);
-      }}
-      .filter-row {{
-        display: flex;
-        flex-wrap: wrap;
-        gap: 8px;
-        align-items: center;
-        margin-top: 10px;
-      }}
-      .filter-label {{
-        font-size: 12px;
-        text-transform: uppercase;
-        letter-spacing: 0.04em;
-        color: var(--muted);
-      }}
-      .pill.selected {{
-        background: var(--accent);
-        color: white;
-      }}
-      .pill.soft {{
-        background: #f1e9df;
-        color: var(--muted);
-      }}
-      .missing-summary {{
-        display: flex;
-        flex-wrap: wrap;
-        gap: 6px;
-        margin: 10px 0 2px;
-      }}
-      .req {{
-        color: var(--accent-2);
-        margin-left: 4px;
-        font-weight: 600;
-      }}
-      .field.required input,
-      .field.required select {{
-        border-color: rgba(226, 109, 92, 0.45);
-        background: #fff4f1;
-      }}
-      .field-hint {{
-        font-size: 12px;
-        color: var(--muted);
-        margin-top: 4px;
-      }}
-      .field-hint.warn {{
-        color: var(--accent-2);
-      }}
-      .edit-form {{
-        margin-top: 10px;
-      }}
-      .edit-form .field {{
-        margin-top: 10px;
-      }}
-      .edit-actions {{
-        display: flex;
-        flex-wrap: wrap;
-        gap: 8px;
-        margin-top: 12px;
-      }}
-      .badge {{
-        display: inline-flex;
-        align-items: center;
-        padding: 2px 8px;
-        border-radius: 999px;
-        font-size: 11px;
-        background: rgba(226, 109, 92, 0.12);
-        color: var(--accent-2);
-        margin-left: 8px;
-      }}
-      .badge.pending {{
-        background: rgba(226, 109, 92, 0.12);
-        color: var(--accent-2);
-      }}
-      .badge.approved {{
-        background: rgba(28, 124, 123, 0.12);
-        color: var(--accent);
-      }}
-      .badge.rejected {{
-        background: rgba(226, 109, 92, 0.2);
-        color: var(--accent-2);
-      }}
-      .badge.conf {{
-        margin-left: 6px;
-      }}
-      .badge.conf.status-good {{
-        background: rgba(28, 124, 123, 0.12);
-        color: var(--accent);
-      }}
-      .badge.conf.status-warn {{
-        background: rgba(242, 193, 78, 0.18);
-        color: #a96d00;
-      }}
-      .badge.conf.status-bad {{
-        background: rgba(226, 109, 92, 0.18);
-        color: var(--accent-2);
-      }}
-      .pill.status-good {{
-        background: rgba(28, 124, 123, 0.16);
-        color: var(--accent);
-      }}
-      .pill.status-warn {{
-        background: rgba(242, 193, 78, 0.18);
-        color: #a96d00;
-      }}
-      .pill.status-bad {{
-        background: rgba(226, 109, 92, 0.18);
-        color: var(--accent-2);
-      }}
-      .review-grid {{
-        display: grid;
-        gap: 20px;
-      }}
-      .event-actions {{
-        margin-top: 10px;
-        display: flex;
-        gap: 8px;
-        flex-wrap: wrap;
-      }}
-      .loading {{
-        position: fixed;
-        inset: 0;
-        background: rgba(246, 241, 234, 0.9);
-        display: none;
-        align-items: center;
-        justify-content: center;
-        z-index: 999;
-      }}
-      .loading-card {{
-        background: white;
-        padding: 18px 22px;
-        border-radius: 16px;
-        border: 1px solid var(--border);
-        box-shadow: var(--shadow);
-        text-align: center;
-      }}
-      .spinner {{
-        width: 24px;
-        height: 24px;
-        border-radius: 50%;
-        border: 3px solid var(--border);
-        border-top-color: var(--accent);
-        margin: 0 auto 10px;
-        animation: spin 1s linear infinite;
-      }}
-      @keyframes pulse {{
-        0% {{ transform: scale(1); }}
-        50% {{ transform: scale(1.01); }}
-        100% {{ transform: scale(1); }}
-      }}
-      .modal {{
-        position: fixed;
-        inset: 0;
-        background: rgba(20, 15, 10, 0.6);
-        display: none;
-        align-items: center;
-        justify-content: center;
-        padding: 20px;
-        z-index: 1000;
-      }}
-      .modal.active {{
-        display: flex;
-      }}
-      .modal-content {{
-        background: white;
-        border-radius: 16px;
-        padding: 14px;
-        max-width: 92vw;
-        max-height: 90vh;
-        overflow: auto;
-        border: 1px solid var(--border);
-      }}
-      .modal-header {{
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 12px;
-      }}
-      @keyframes spin {{
-        to {{ transform: rotate(360deg); }}
-      }}
-      details {{
-        margin-top: 14px;
-      }}
-      details summary {{
-        cursor: pointer;
-        font-weight: 600;
-      }}
-      pre {{
-        white-space: pre-wrap;
-        word-break: break-word;
-        background: #f5efe7;
-        padding: 12px;
-        border-radius: 12px;
-        border: 1px solid var(--border);
-      }}
-      .reveal {{
-        animation: fadeUp 0.6s ease both;
-      }}
-      @keyframes fadeUp {{
-        from {{ opacity: 0; transform: translateY(12px); }}
-        to {{ opacity: 1; transform: translateY(0); }}
-      }}
-      @media (min-width: 900px) {{
-        .hero {{
-          grid-template-columns: 1.1fr 0.9fr;
-          align-items: start;
-        }}
-        .review-grid {{
-          grid-template-columns: 1.2fr 0.8fr;
-          grid-template-areas:
-            "summary poster"
-            "list poster";
-          align-items: start;
-        }}
-        .review-summary {{ grid-area: summary; }}
-        .review-poster {{ grid-area: poster; }}
-        .review-list {{ grid-area: list; }}
-        .button {{
-          width: auto;
-        }}
-        .actions .button {{
-          width: auto;
-        }}
-      }}
-      @media (max-width: 900px) {{
-        .poster-peek {{
-          display: grid;
-          gap: 10px;
-        }}
-        .event-panel {{
-          position: fixed;
-          inset: 0;
-          z-index: 60;
-          display: none;
-        }}
-        .event-panel[data-open="true"] {{
-          display: block;
-        }}
-        .event-panel-backdrop {{
-          display: block;
-          position: absolute;
-          inset: 0;
-          background: rgba(15, 23, 28, 0.55);
-        }}
-        .event-detail {{
-          position: absolute;
-          left: 0;
-          right: 0;
-          bottom: 0;
-          max-height: 85vh;
-          overflow-y: auto;
-          border-radius: 20px 20px 0 0;
-          box-shadow: 0 -14px 40px rgba(17, 24, 39, 0.2);
-          transform: translateY(100%);
-          transition: transform 0.25s ease;
-        }}
-        .event-panel[data-open="true"] .event-detail {{
-          transform: translateY(0);
-        }}
-        .event-panel-header {{
-          display: flex;
-        }}
-      }}
-      @media (min-width: 1100px) {{
-        .poster-grid {{
-          grid-template-columns: 1.2fr 0.8fr;
-          align-items: start;
-        }}
-        .event-detail {{
-          position: sticky;
-          top: 20px;
-        }}
-      }}
-    </style>
+    <title>"""
+
+_PAGE_MID = f"""
+    <link rel="stylesheet" href="/static/app.css?v={ASSET_VERSION}">
+    <script defer src="/static/app.js?v={ASSET_VERSION}"></script>
   </head>
   <body>
     <div class="container">
-      {body}
+      """
+
+_PAGE_TAIL = """
     </div>
     <div class="loading" id="loading">
       <div class="loading-card">
@@ -721,315 +178,109 @@ def _render_page(body: str, title: str = "Artist Calendar") -> str:
         <div class="hint">This can take up to 30 seconds.</div>
       </div>
     </div>
-    <script>
-      document.addEventListener('DOMContentLoaded', () => {{
-        const form = document.querySelector('form[data-import]');
-        const loading = document.getElementById('loading');
-        const status = document.getElementById('loading-status');
-        if (form && loading) {{
-          form.addEventListener('submit', () => {{
-            loading.style.display = 'flex';
-            if (status) {{
-              const messages = [
-                'Downloading image…',
-                'Reading poster…',
-                'Extracting dates…',
-                'Saving to your library…'
-              ];
-              let index = 0;
-              status.textContent = messages[index];
-              setInterval(() => {{
-                index = (index + 1) % messages.length;
-                status.textContent = messages[index];
-              }}, 3500);
-            }}
-          }});
-        }}
-
-        const openButtons = document.querySelectorAll('[data-modal-open]');
-        const closeButtons = document.querySelectorAll('[data-modal-close]');
-        openButtons.forEach((button) => {{
-          button.addEventListener('click', () => {{
-            const target = button.getAttribute('data-modal-open');
-            const modal = document.getElementById(target);
-            if (modal) {{
-              modal.classList.add('active');
-            }}
-          }});
-        }});
-        closeButtons.forEach((button) => {{
-          button.addEventListener('click', () => {{
-            const modal = button.closest('.modal');
-            if (modal) {{
-              modal.classList.remove('active');
-            }}
-          }});
-        }});
-        document.querySelectorAll('.modal').forEach((modal) => {{
-          modal.addEventListener('click', (event) => {{
-            if (event.target === modal) {{
-              modal.classList.remove('active');
-            }}
-          }});
-        }});
-
-        const applyLocationRequirement = (form, locationType) => {{
-          const requiredFields = form.querySelectorAll('[data-required-field]');
-          if (!requiredFields.length) return;
-          const normalized = (locationType || 'public').toLowerCase();
-          const requiresLocation = normalized !== 'internal' && normalized !== 'private';
-          requiredFields.forEach((wrapper) => {{
-            const key = wrapper.getAttribute('data-required-field');
-            if (!key) return;
-            const scope = wrapper.getAttribute('data-required-scope') || 'always';
-            const required = scope === 'always' ? true : requiresLocation;
-            const input = wrapper.querySelector(`[name=\"${{key}}\"]`);
-            const value = input && 'value' in input ? input.value.trim() : '';
-            const isMissing = required && !value;
-            wrapper.classList.toggle('required', isMissing);
-            const hint = wrapper.querySelector('[data-required-hint]');
-            if (hint) {{
-              hint.style.display = isMissing ? 'block' : 'none';
-            }}
-          }});
-        }};
-
-        document.querySelectorAll('form').forEach((formEl) => {{
-          const locationSelect = formEl.querySelector('select[name=\"location_type\"]');
-          if (!locationSelect) return;
-          applyLocationRequirement(formEl, locationSelect.value);
-          locationSelect.addEventListener('change', () => {{
-            applyLocationRequirement(formEl, locationSelect.value);
-          }});
-          formEl.querySelectorAll('[data-required-field]').forEach((wrapper) => {{
-            const key = wrapper.getAttribute('data-required-field');
-            if (!key) return;
-            const input = wrapper.querySelector(`[name=\"${{key}}\"]`);
-            if (!input) return;
-            input.addEventListener('input', () => {{
-              applyLocationRequirement(formEl, locationSelect.value);
-            }});
-          }});
-        }});
-
-        const params = new URLSearchParams(window.location.search);
-        const focusId = params.get('focus');
-        if (focusId) {{
-          const target = document.getElementById(`event-${{focusId}}`);
-          if (target) {{
-            target.classList.add('focus');
-            target.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-          }}
-        }}
-
-        const eventDataScript = document.getElementById('event-data');
-        if (eventDataScript) {{
-          let eventData = {{}};
-          try {{
-            eventData = JSON.parse(eventDataScript.textContent || '{{}}');
-          }} catch (error) {{
-            eventData = {{}};
-          }}
-          const detail = document.getElementById('event-detail');
-          if (detail) {{
-            const form = detail.querySelector('form');
-            const titleEl = detail.querySelector('#event-title');
-            const confEl = detail.querySelector('#event-conf');
-            const missingEl = detail.querySelector('#event-missing');
-            const posterId = detail.getAttribute('data-poster-id') || '';
-            const panel = document.getElementById('event-panel');
-            const requiredFields = detail.querySelectorAll('[data-required-field]');
-            const isMobile = () => window.matchMedia('(max-width: 900px)').matches;
-            const setPanelOpen = (open) => {{
-              if (!panel) return;
-              panel.dataset.open = open ? 'true' : 'false';
-              document.body.classList.toggle('panel-open', open);
-            }};
-            const closePanel = () => {{
-              setPanelOpen(false);
-              const url = new URL(window.location.href);
-              url.searchParams.delete('event');
-              history.replaceState({{}}, '', url.toString());
-            }};
-
-            document.querySelectorAll('[data-event-close]').forEach((button) => {{
-              button.addEventListener('click', () => {{
-                closePanel();
-              }});
-            }});
-            window.addEventListener('resize', () => {{
-              if (!isMobile()) {{
-                setPanelOpen(false);
-              }}
-            }});
-
-            const titleCase = (value) => value ? value[0].toUpperCase() + value.slice(1) : value;
-            const renderMissing = (fields) => {{
-              if (!fields || !fields.length) return '';
-              const chips = fields.map((field) => `<span class="chip warn">${{titleCase(field)}}</span>`).join('');
-              return `<div class="missing-summary"><span class="filter-label">Missing</span>${{chips}}</div>`;
-            }};
-            const confidenceClass = (value) => {{
-              if (value >= 0.8) return 'status-good';
-              if (value >= 0.6) return 'status-warn';
-              return 'status-bad';
-            }};
-            const renderConfidence = (value) => {{
-              if (value === null || value === undefined || Number.isNaN(value)) return '';
-              const label = `${{Math.round(value * 100)}}%`;
-              const klass = confidenceClass(value);
-              return `<span class="pill ${{klass}}">conf ${{label}}</span>`;
-            }};
-            const setActiveCard = (eventId) => {{
-              document.querySelectorAll('.event-card.active').forEach((card) => {{
-                card.classList.remove('active');
-              }});
-              const card = document.getElementById(`event-${{eventId}}`);
-              if (card) {{
-                card.classList.add('active');
-              }}
-            }};
-            const setRequiredState = (wrapper, required) => {{
-              const key = wrapper.getAttribute('data-required-field');
-              if (!key) return;
-              const input = wrapper.querySelector(`[name=\"${{key}}\"]`);
-              const value = input && 'value' in input ? input.value.trim() : '';
-              const isMissing = required && !value;
-              wrapper.classList.toggle('required', isMissing);
-              const hint = wrapper.querySelector('[data-required-hint]');
-              if (hint) {{
-                hint.style.display = isMissing ? 'block' : 'none';
-              }}
-            }};
-            const applyLocationRequirement = (locationType) => {{
-              const normalized = (locationType || 'public').toLowerCase();
-              const requiresLocation = normalized !== 'internal' && normalized !== 'private';
-              requiredFields.forEach((wrapper) => {{
-                const scope = wrapper.getAttribute('data-required-scope') || 'always';
-                const required = scope === 'always' ? true : requiresLocation;
-                setRequiredState(wrapper, required);
-              }});
-              if (missingEl) {{
-                if (!requiresLocation) {{
-                  missingEl.innerHTML = '<div class=\"missing-summary\"><span class=\"pill soft\">Internal event</span></div>';
-                }} else {{
-                  const fields = ['venue', 'city', 'province'];
-                  const missingFields = fields.filter((field) => {{
-                    const input = form && form.querySelector(`[name=\"${{field}}\"]`);
-                    return !input || !input.value.trim();
-                  }});
-                  missingEl.innerHTML = renderMissing(missingFields);
-                }}
-              }}
-            }};
-
-            const selectEvent = (eventId, options = {{}}) => {{
-              const data = eventData[eventId];
-              if (!data || !form) return;
-              const {{ skipUrl = false, open = true, scroll = false }} = options;
-
-              detail.classList.remove('empty');
-              detail.dataset.selectedEvent = eventId;
-              if (titleEl) {{
-                titleEl.textContent = data.event_name || data.venue || 'Untitled event';
-              }}
-              if (confEl) {{
-                confEl.innerHTML = renderConfidence(data.confidence);
-              }}
-              if (missingEl) {{
-                missingEl.innerHTML = renderMissing(data.missing_fields);
-              }}
-              form.setAttribute('action', `/event/${{eventId}}`);
-              const returnInput = form.querySelector('input[name=\"return\"]');
-              if (returnInput && posterId) {{
-                returnInput.value = `/poster/${{posterId}}?event=${{eventId}}`;
-              }}
-              const fields = ['date', 'event_name', 'location_type', 'venue', 'city', 'province', 'time', 'ticket_info', 'status'];
-              fields.forEach((field) => {{
-                const input = form.querySelector(`[name=\"${{field}}\"]`);
-                if (!input) return;
-                if (field === 'status') {{
-                  input.value = data.status || 'active';
-                }} else if (field === 'location_type') {{
-                  input.value = data.location_type || 'public';
-                }} else {{
-                  input.value = data[field] || '';
-                }}
-              }});
-              applyLocationRequirement(data.location_type);
-              setActiveCard(eventId);
-              if (scroll) {{
-                const card = document.getElementById(`event-${{eventId}}`);
-                if (card) {{
-                  card.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-                }}
-              }}
-              if (!skipUrl) {{
-                const url = new URL(window.location.href);
-                url.searchParams.set('event', eventId);
-                history.replaceState({{}}, '', url.toString());
-              }}
-              if (open && isMobile()) {{
-                setPanelOpen(true);
-              }}
-            }};
-
-            document.querySelectorAll('[data-event-select]').forEach((button) => {{
-              button.addEventListener('click', (event) => {{
-                event.preventDefault();
-                const eventId = button.getAttribute('data-event-select');
-                if (eventId) {{
-                  selectEvent(eventId);
-                }}
-              }});
-            }});
-
-            document.querySelectorAll('.event-card').forEach((card) => {{
-              card.addEventListener('click', (event) => {{
-                if (event.target.closest('a, button, input, select, textarea, label')) return;
-                const eventId = card.getAttribute('data-event-id');
-                if (eventId) {{
-                  selectEvent(eventId);
-                }}
-              }});
-            }});
-
-            const locationSelect = detail.querySelector('select[name=\"location_type\"]');
-            if (locationSelect) {{
-              locationSelect.addEventListener('change', () => {{
-                applyLocationRequirement(locationSelect.value);
-              }});
-              applyLocationRequirement(locationSelect.value);
-            }}
-            requiredFields.forEach((wrapper) => {{
-              const key = wrapper.getAttribute('data-required-field');
-              if (!key) return;
-              const input = wrapper.querySelector(`[name=\"${{key}}\"]`);
-              if (!input) return;
-              input.addEventListener('input', () => {{
-                const locationValue = locationSelect ? locationSelect.value : 'public';
-                applyLocationRequirement(locationValue);
-              }});
-            }});
-
-            const initialParam = params.get('event');
-            const initialId = initialParam || detail.getAttribute('data-selected-event') || Object.keys(eventData)[0];
-            if (initialId) {{
-              selectEvent(initialId, {{
-                skipUrl: true,
-                open: Boolean(initialParam),
-                scroll: Boolean(initialParam),
-              }});
-            }}
-          }}
-        }}
-      }});
-    </script>
   </body>
 </html>
 """
 
 
+def _render_page(body: str, title: str = "Artist Calendar", refresh: int | None = None) -> str:
+    head_extra = f'\n    <meta http-equiv="refresh" content="{refresh}">' if refresh else ""
+    return "".join((_PAGE_HEAD, title, "</title>", head_extra, _PAGE_MID, body, _PAGE_TAIL))
+
+
+_TOPBAR = """
+<header class="topbar">
+  <div class="brand">
+    <div class="logo">AC</div>
+    <div>
+      <div class="brand-title">Artist Calendar</div>
+      <div class="brand-sub">{subtitle}</div>
+    </div>
+  </div>
+  {actions}
+</header>
+"""
+
+
+def _topbar(subtitle: str, actions: str) -> str:
+    return _TOPBAR.format(subtitle=subtitle, actions=actions)
+
+
+def _message_page(
+    subtitle: str,
+    back_href: str,
+    back_label: str,
+    heading: str,
+    message: str,
+    lead: str = "",
+    actions: str = "",
+    title: str = "Artist Calendar",
+    refresh: int | None = None,
+) -> str:
+    return _render_page(
+        _topbar(subtitle, f'<a class="button ghost" href="{back_href}">{back_label}</a>')
+        + f"""<div class="card">
+  {lead}<h2>{heading}</h2>
+  <p>{message}</p>
+  {actions}
+</div>
+""",
+        title=title,
+        refresh=refresh,
+    )
+
+
+_POSTER_MODAL = """
+<div class="modal" id="poster-modal">
+  <div class="modal-content">
+    <div class="modal-header">
+      <strong>Poster</strong>
+      <button class="button ghost small" type="button" data-modal-close>Close</button>
+    </div>
+    <img src="{src}" alt="poster" class="poster-image full">
+  </div>
+</div>
+"""
+_LIBRARY_LINK = '<div class="actions"><a class="button ghost" href="/db">Go to library</a></div>'
+
+
+@app.teardown_request
+def _discard_upload_spool(exc: BaseException | None = None) -> None:
+    for path in request.__dict__.get("upload_spool_paths", ()):
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+
+
+@lru_cache(maxsize=8)
+def _gzipped_asset(path: str, mtime_ns: int) -> bytes:
+    with open(path, "rb") as f:
+        return gzip.compress(f.read(), compresslevel=9, mtime=0)
+
+
+@app.get("/static/<path:filename>")
+def static_asset(filename: str):
+    path = safe_join(str(STATIC_DIR), filename)
+    if path and "gzip" in request.accept_encodings and os.path.isfile(path):
+        stat = os.stat(path)
+        response = Response(
+            _gzipped_asset(path, stat.st_mtime_ns),
+            mimetype=mimetypes.guess_type(path)[0] or "application/octet-stream",
+        )
+        response.headers["Content-Encoding"] = "gzip"
+        response.vary.add("Accept-Encoding")
+        response.set_etag(f"{stat.st_mtime_ns:x}-{stat.st_size:x}-gz")
+        response.cache_control.public = True
+        response.cache_control.max_age = STATIC_MAX_AGE
+        response.cache_control.immutable = True
+        return response.make_conditional(request)
+    response = send_from_directory(STATIC_DIR, filename, max_age=STATIC_MAX_AGE)
+    response.vary.add("Accept-Encoding")
+    response.cache_control.immutable = True
+    return response
+
+
 @app.get("/")
 def index() -> str:
     return _render_page(
@@ -1095,285 +346,320 @@ def index() -> str:
     )
 
 
+_POSTER_SQL = """
+    SELECT p.id, p.image_url, p.source_month, p.tour_name, p.created_at,
+           p.source_url, p.poster_confidence, a.name AS artist_name,
+           p.pending_count, p.approved_count, p.rejected_count
+    FROM posters p
+    JOIN artists a ON a.id = p.artist_id
+    WHERE p.id = ?
+"""
+
+# review_view unpacks these columns by position.
+_EVENTS_SQL = """
+    SELECT id, date, event_name, venue, city, province, location_type, time,
+           ticket_info, status, review_status, confidence
+    FROM events
+    WHERE poster_id = ?
+    ORDER BY date, rowid
+"""
+
+
+# Library rows by limit; writes through this process clear it, other writers show up within the TTL.
+_POSTERS_CACHE: dict[int, tuple[float, list[sqlite3.Row]]] = {}
+# Bumped on every invalidation so a query that raced a write does not cache pre-write rows.
+_POSTERS_GENERATION = 0
+_POSTERS_CACHE_LOCK = threading.Lock()
+
+
+def _invalidate_posters_cache() -> None:
+    global _POSTERS_GENERATION
+    with _POSTERS_CACHE_LOCK:
+        _POSTERS_GENERATION += 1
+        _POSTERS_CACHE.clear()
+
+
 def _fetch_posters(limit: int = 50):
     if not DB_PATH.exists():
         return []
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row
-    rows = conn.execute(
+    cached = _POSTERS_CACHE.get(limit)
+    now = time.monotonic()
+    if cached and now - cached[0] <= POSTERS_CACHE_TTL:
+        return cached[1]
+    generation = _POSTERS_GENERATION
+    rows = _db().execute(
         """
         SELECT p.id, p.image_url, p.source_month, p.tour_name, p.created_at,
                p.poster_confidence, p.source_url, p.source_post_id, p.image_hash,
-               a.name AS artist_name,
-               COUNT(e.id) AS event_count,
-               SUM(CASE WHEN e.review_status = 'approved' THEN 1 ELSE 0 END) AS approved_count,
-               SUM(CASE WHEN e.review_status = 'pending' THEN 1 ELSE 0 END) AS pending_count,
-               SUM(CASE WHEN e.review_status = 'rejected' THEN 1 ELSE 0 END) AS rejected_count
+               a.name AS artist_name, p.event_count, p.approved_count,
+               p.pending_count, p.rejected_count
         FROM posters p
         JOIN artists a ON a.id = p.artist_id
-        LEFT JOIN events e ON e.poster_id = p.id
-        GROUP BY p.id, p.image_url, p.source_month, p.tour_name, p.created_at,
-                 p.poster_confidence, p.source_url, p.source_post_id, p.image_hash, a.name
-        ORDER BY p.created_at DESC
+        ORDER BY p.created_at DESC, p.rowid DESC
         LIMIT ?
         """,
         (limit,),
     ).fetchall()
-    conn.close()
+    with _POSTERS_CACHE_LOCK:
+        if generation == _POSTERS_GENERATION:
+            _POSTERS_CACHE[limit] = (now, rows)
     return rows
 
 
-def _fetch_poster(poster_id: str):
+def _fetch_poster_with_events(poster_id: str):
     if not DB_PATH.exists():
-        return None
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row
-    row = conn.execute(
-        """
-        SELECT p.id, p.image_url, p.source_month, p.tour_name, p.created_at,
-               p.source_url, p.raw_json, p.poster_confidence, a.name AS artist_name
-        FROM posters p
-        JOIN artists a ON a.id = p.artist_id
-        WHERE p.id = ?
-        """,
-        (poster_id,),
-    ).fetchone()
-    conn.close()
-    return row
-
-
-def _fetch_events(poster_id: str):
-    if not DB_PATH.exists():
-        return []
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row
-    rows = conn.execute(
-        """
-        SELECT id, date, event_name, venue, city, province, location_type, time,
-               ticket_info, status, review_status, confidence
-        FROM events
-        WHERE poster_id = ?
-        ORDER BY date
-        """,
-        (poster_id,),
-    ).fetchall()
-    conn.close()
-    return rows
+        return None, []
+    conn = _db()
+    poster = conn.execute(_POSTER_SQL, (poster_id,)).fetchone()
+    if not poster:
+        return None, []
+    return poster, conn.execute(_EVENTS_SQL, (poster_id,)).fetchall()
 
 
-def _fetch_event(event_id: str):
+def _fetch_event_with_poster(event_id: str):
     if not DB_PATH.exists():
         return None
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row
-    row = conn.execute(
+    row = _db().execute(
         """
-        SELECT id, poster_id, date, event_name, venue, city, province, location_type,
-               time, ticket_info, status, review_status, confidence
-        FROM events
-        WHERE id = ?
+        SELECT e.id, e.poster_id, e.date, e.event_name, e.venue, e.city, e.province,
+               e.location_type, e.time, e.ticket_info, e.status, e.review_status,
+               e.confidence, p.image_url AS poster_image_url
+        FROM events e
+        LEFT JOIN posters p ON p.id = e.poster_id
+        WHERE e.id = ?
         """,
         (event_id,),
     ).fetchone()
-    conn.close()
     return row
 
 
-def _update_event(event_id: str, fields: dict, review_status: str | None) -> None:
-    updates = []
-    params = []
-    for key in (
-        "date",
-        "event_name",
-        "venue",
-        "city",
-        "province",
-        "location_type",
-        "time",
-        "ticket_info",
-        "status",
-    ):
-        if key in fields:
-            updates.append(f"{key} = ?")
-            params.append(fields[key] or None)
+_EVENT_UPDATE_COLUMNS = (
+    "date",
+    "event_name",
+    "venue",
+    "city",
+    "province",
+    "location_type",
+    "time",
+    "ticket_info",
+    "status",
+)
+
+
+_ACTION_REVIEW_STATUS = {
+    "approve": "approved",
+    "approve_next": "approved",
+    "reject": "rejected",
+    "save_pending": "pending",
+}
+
+
+# Where each approve action lands when the poster still has pending events.
+_APPROVE_NEXT_URLS = {
+    "approve": "/review/{poster_id}?focus={next_id}",
+    "approve_next": "/event/{next_id}?return=/review/{poster_id}",
+}
+
 
+@lru_cache(maxsize=64)
+def _update_event_sql(columns: tuple[str, ...], with_review_status: bool) -> str:
+    assignments = [f"{key} = ?" for key in columns]
+    if with_review_status:
+        assignments.append("review_status = ?")
+    assignments.append("updated_at = ?")
+    return f"UPDATE events SET {', '.join(assignments)} WHERE id = ?"
+
+
+def _update_event(event_id: str, fields: dict, review_status: str | None) -> None:
+    columns = tuple(key for key in _EVENT_UPDATE_COLUMNS if key in fields)
+    params = [fields[key] or None for key in columns]
     if review_status:
-        updates.append("review_status = ?")
         params.append(review_status)
-
-    updates.append("updated_at = ?")
     params.append(_now())
-
     params.append(event_id)
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.execute(
-        f"UPDATE events SET {', '.join(updates)} WHERE id = ?",
-        params,
-    )
-    conn.commit()
-    conn.close()
+    with _db_write() as conn:
+        conn.execute(_update_event_sql(columns, bool(review_status)), params)
 
 
 def _approve_all_events(poster_id: str) -> None:
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.execute(
-        "UPDATE events SET review_status = ?, updated_at = ? WHERE poster_id = ?",
-        ("approved", _now(), poster_id),
+    with _db_write() as conn:
+        conn.execute(
+            """
+            UPDATE events SET review_status = 'approved', updated_at = ?
+            WHERE poster_id = ? AND review_status IS NOT 'approved'
+            """,
+            (_now(), poster_id),
+        )
+
+
+# First pending event on or after the current one's date, else the earliest pending event.
+_NEXT_PENDING_SQL = """
+    SELECT id
+    FROM (
+        SELECT * FROM (
+            SELECT 1 AS priority, e.id
+            FROM events e, (SELECT date FROM events WHERE id = :current_id) cur
+            WHERE e.poster_id = :poster_id AND e.review_status = 'pending'
+              AND e.date >= cur.date AND e.id != :current_id
+            ORDER BY e.date, e.id
+            LIMIT 1
+        )
+        UNION ALL
+        SELECT * FROM (
+            SELECT 2, id
+            FROM events
+            WHERE poster_id = :poster_id AND review_status = 'pending'
+            ORDER BY date, id
+            LIMIT 1
+        )
     )
-    conn.commit()
-    conn.close()
+    ORDER BY priority
+    LIMIT 1
+"""
 
 
 def _next_pending_event_id(poster_id: str, current_event_id: str) -> str | None:
     if not DB_PATH.exists():
         return None
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row
-    current = conn.execute(
-        "SELECT date FROM events WHERE id = ?",
-        (current_event_id,),
+    row = _db().execute(
+        _NEXT_PENDING_SQL,
+        {"poster_id": poster_id, "current_id": current_event_id},
     ).fetchone()
-    current_date = current["date"] if current else None
-    rows = conn.execute(
-        """
-        SELECT id, date
-        FROM events
-        WHERE poster_id = ? AND review_status = 'pending'
-        ORDER BY date, id
-        """,
-        (poster_id,),
-    ).fetchall()
-    conn.close()
-    if not rows:
-        return None
-    if current_date:
-        for row in rows:
-            if row["date"] >= current_date and row["id"] != current_event_id:
-                return row["id"]
-    return rows[0]["id"]
+    return row["id"] if row else None
 
 
-@app.get("/review/<poster_id>")
-def review_view(poster_id: str) -> str:
-    poster = _fetch_poster(poster_id)
-    if not poster:
-        return _render_page(
-            """
-            <header class="topbar">
-              <div class="brand">
-                <div class="logo">AC</div>
-                <div>
-                  <div class="brand-title">Artist Calendar</div>
-                  <div class="brand-sub">Review</div>
+_APPROVE_ALL_CONFIRM_JS = json.dumps("Approve all events?")
+
+_REVIEW_EVENT_CARD = """
+            <div class="event-card{missing_class}" id="event-{event_id}">
+              <div class="event-date">{date}</div>
+              <div>
+                <div class="event-title">{title}
+                  <span class="badge {status_class}">{status}</span>
+                  {conf_badge}
+                </div>
+                <div class="event-meta">{location}</div>
+                {missing_chips}
+                <div class="event-actions">
+                  <a class="button ghost small" href="/event/{event_id}?return=/review/{poster_id}">Review</a>
+                  {quick_approve}
                 </div>
               </div>
-              <a class="button ghost" href="/db">Back</a>
-            </header>
-            <div class="card">
-              <h2>Poster not found</h2>
-              <p>We could not locate this poster in the local database.</p>
             </div>
             """
-        )
 
-    events = _fetch_events(poster_id)
-    pending_events = [row for row in events if row["review_status"] == "pending"]
-    pending_count = len(pending_events)
-    approved_count = sum(1 for row in events if row["review_status"] == "approved")
-    rejected_count = sum(1 for row in events if row["review_status"] == "rejected")
-    status_label, status_class = _poster_status(len(events), pending_count, rejected_count)
-    poster_conf_pill = _confidence_pill(poster["poster_confidence"])
+_QUICK_APPROVE_FORM = (
+    '<form method="post" action="/event/{event_id}">'
+    '<input type="hidden" name="poster_id" value="{poster_id}">'
+    '<input type="hidden" name="return" value="/review/{poster_id}">'
+    '<button class="button small" name="action" value="approve">Approve</button>'
+    "</form>"
+)
+
+
+_REVIEW_NOT_FOUND_PAGE = _message_page(
+    "Review", "/db", "Back", "Poster not found", "We could not locate this poster in the local database."
+).encode()
+
+
+@app.get("/review/<poster_id>")
+def review_view(poster_id: str) -> str | bytes:
+    poster, events = _fetch_poster_with_events(poster_id)
+    if not poster:
+        return _REVIEW_NOT_FOUND_PAGE
+
     show_all = request.args.get("show") == "all"
     missing_filter = request.args.get("missing")
     allowed_missing = {"any", "venue", "city", "province", "complete"}
     if missing_filter not in allowed_missing:
         missing_filter = None
-    base_events = events if show_all else pending_events
+    status_counts = {"pending": 0, "approved": 0, "rejected": 0}
     missing_counts = {key: 0 for key in allowed_missing}
-    for row in base_events:
-        missing_fields = _missing_fields(row)
-        if missing_fields:
+    missing_total = 0
+    pending_missing_count = 0
+    filtered = []
+    for row in events:
+        (
+            event_id, date, event_name, venue, city, province, location_type,
+            _time, _ticket_info, _status, review_status, confidence,
+        ) = row
+        if review_status in status_counts:
+            status_counts[review_status] += 1
+        if not show_all and review_status != "pending":
+            continue
+        missing = _missing_mask(location_type, venue, city, province)
+        missing_total += 1
+        if missing:
             missing_counts["any"] += 1
+            if review_status == "pending":
+                pending_missing_count += 1
+            for field in _MISSING_NAMES[missing]:
+                missing_counts[field] += 1
         else:
             missing_counts["complete"] += 1
-        for field in missing_fields:
-            if field in missing_counts:
-                missing_counts[field] += 1
-
-    def _matches_missing(row: dict) -> bool:
-        missing_fields = _missing_fields(row)
-        if missing_filter == "any":
-            return bool(missing_fields)
-        if missing_filter == "complete":
-            return not missing_fields
-        if missing_filter in {"venue", "city", "province"}:
-            return missing_filter in missing_fields
-        return True
-
-    filtered = [row for row in base_events if _matches_missing(row)]
-    pending_missing_count = sum(1 for row in pending_events if _missing_fields(row))
-    confirm_message = "Approve all events?"
+        if (
+            missing_filter is None
+            or (missing_filter == "any" and missing)
+            or (missing_filter == "complete" and not missing)
+            or missing & _MISSING_BITS.get(missing_filter, 0)
+        ):
+            filtered.append(
+                (event_id, date, event_name, venue, city, province, review_status, confidence, missing)
+            )
+    pending_count = status_counts["pending"]
+    approved_count = status_counts["approved"]
+    rejected_count = status_counts["rejected"]
+    status_label, status_class = _poster_status(len(events), pending_count, rejected_count)
+    poster_conf_pill = _confidence_pill(poster["poster_confidence"])
+    confirm_message_js = _APPROVE_ALL_CONFIRM_JS
     if pending_missing_count:
-        confirm_message = (
+        confirm_message_js = json.dumps(
             f"Approve all events? {pending_missing_count} pending events still missing "
             "venue, city, or province."
         )
-    confirm_message_js = json.dumps(confirm_message)
-    missing_total = len(base_events)
-    pending_url = _review_url(poster_id, False, missing_filter)
-    all_url = _review_url(poster_id, True, missing_filter)
-    missing_all_url = _review_url(poster_id, show_all, None)
-    missing_any_url = _review_url(poster_id, show_all, "any")
-    missing_venue_url = _review_url(poster_id, show_all, "venue")
-    missing_city_url = _review_url(poster_id, show_all, "city")
-    missing_province_url = _review_url(poster_id, show_all, "province")
-    missing_complete_url = _review_url(poster_id, show_all, "complete")
-
+    pending_url = f"/review/{poster_id}"
+    all_url = f"{pending_url}?show=all"
+    current_url = all_url if show_all else pending_url
+    missing_prefix = f"{current_url}{'&' if show_all else '?'}missing="
+    if missing_filter:
+        pending_url = f"{pending_url}?missing={missing_filter}"
+        all_url = f"{all_url}&missing={missing_filter}"
+    missing_all_url = current_url
+    missing_any_url = f"{missing_prefix}any"
+    missing_venue_url = f"{missing_prefix}venue"
+    missing_city_url = f"{missing_prefix}city"
+    missing_province_url = f"{missing_prefix}province"
+    missing_complete_url = f"{missing_prefix}complete"
+
+    esc_poster_id = _esc(poster_id)
     event_cards = []
-    for row in filtered:
-        title = row["event_name"] or row["venue"] or "Untitled event"
-        location = _format_location(row["venue"], row["city"], row["province"])
-        missing_fields = _missing_fields(row)
-        missing_class = " has-missing" if missing_fields else ""
-        missing_chips = ""
-        if missing_fields:
-            chips = "".join(
-                f'<span class="chip warn">{_esc(field.title())}</span>'
-                for field in missing_fields
-            )
-            missing_chips = f'<div class="missing-chips">{chips}</div>'
-        status = row["review_status"] or "pending"
-        status_class = status if status in {"approved", "rejected"} else "pending"
-        conf_badge = _confidence_badge(row["confidence"])
-
+    for (
+        event_id, date, event_name, venue, city, province, review_status, confidence, missing,
+    ) in filtered:
+        title = event_name or venue or "Untitled event"
+        location = _format_location(venue, city, province)
+        status = review_status or "pending"
+        esc_event_id = _esc(event_id)
         quick_approve = ""
-        if row["review_status"] != "approved":
-            quick_approve = (
-                f"<form method=\"post\" action=\"/event/{row['id']}\">"
-                f"<input type=\"hidden\" name=\"poster_id\" value=\"{_esc(poster_id)}\">"
-                f"<input type=\"hidden\" name=\"return\" value=\"/review/{poster_id}\">"
-                f"<button class=\"button small\" name=\"action\" value=\"approve\">Approve</button>"
-                f"</form>"
+        if review_status != "approved":
+            quick_approve = _QUICK_APPROVE_FORM.format(
+                event_id=esc_event_id,
+                poster_id=esc_poster_id,
             )
-
         event_cards.append(
-            f"""
-            <div class="event-card{missing_class}" id="event-{_esc(row['id'])}">
-              <div class="event-date">{_esc(_format_event_date(row['date']))}</div>
-              <div>
-                <div class="event-title">{_esc(title)}
-                  <span class="badge {status_class}">{_esc(status)}</span>
-                  {conf_badge}
-                </div>
-                <div class="event-meta">{_esc(location or 'Location not set')}</div>
-                {missing_chips}
-                <div class="event-actions">
-                  <a class="button ghost small" href="/event/{row['id']}?return=/review/{poster_id}">Review</a>
-                  {quick_approve}
-                </div>
-              </div>
-            </div>
-            """
+            _REVIEW_EVENT_CARD.format(
+                missing_class=" has-missing" if missing else "",
+                event_id=esc_event_id,
+                date=_esc(_format_event_date(date)),
+                title=_esc(title),
+                status_class=status if status in {"approved", "rejected"} else "pending",
+                status=_esc(status),
+                conf_badge=_confidence_badge(confidence),
+                location=_esc(location or "Location not set"),
+                missing_chips=_MISSING_CHIPS[missing],
+                poster_id=esc_poster_id,
+                quick_approve=quick_approve,
+            )
         )
 
     image_src = _image_src(poster["image_url"])
@@ -1384,17 +670,7 @@ def review_view(poster_id: str) -> str:
         )
     modal_html = ""
     if image_src:
-        modal_html = f"""
-        <div class="modal" id="poster-modal">
-          <div class="modal-content">
-            <div class="modal-header">
-              <strong>Poster</strong>
-              <button class="button ghost small" type="button" data-modal-close>Close</button>
-            </div>
-            <img src="{image_src}" alt="poster" class="poster-image full">
-          </div>
-        </div>
-        """
+        modal_html = _POSTER_MODAL.format(src=image_src)
 
     return _render_page(
         f"""
@@ -1468,66 +744,97 @@ def review_view(poster_id: str) -> str:
     )
 
 
+@lru_cache(maxsize=256)
+def _parse_url(url: str):
+    return urlparse(url)
+
+
+@lru_cache(maxsize=256)
+def _url_host(url: str) -> str:
+    return _parse_url(url).netloc.lower().split(":")[0]
+
+
+_IMAGE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+}
+
+
 def _guess_extension(url: str, content_type: str | None) -> str:
-    parsed = urlparse(url)
-    suffix = Path(parsed.path).suffix
+    suffix = Path(_parse_url(url).path).suffix
     if suffix:
         return suffix
     if content_type:
-        guessed = mimetypes.guess_extension(content_type.split(";")[0].strip())
+        mime_type = content_type.partition(";")[0].strip().lower()
+        guessed = _IMAGE_EXTENSIONS.get(mime_type) or mimetypes.guess_extension(mime_type)
         if guessed:
             return guessed
     return ".jpg"
 
 
+_secure_filename = lru_cache(maxsize=512)(secure_filename)
+
+
+def _file_timestamp() -> str:
+    t = time.gmtime()
+    return f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}_{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}"
+
+
 def _save_uploaded_file(file) -> Path:
-    filename = secure_filename(file.filename)
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    filename = _secure_filename(file.filename)
+    timestamp = _file_timestamp()
     UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
     image_path = UPLOAD_DIR / f"{timestamp}_{filename}"
-    file.save(image_path)
+    spool_path = getattr(file.stream, "name", None)
+    if isinstance(spool_path, str) and Path(spool_path).parent == UPLOAD_DIR:
+        file.stream.close()
+        os.replace(spool_path, image_path)
+        # NamedTemporaryFile creates 0600; give the poster the mode a plain open() would.
+        os.chmod(image_path, 0o666 & ~_UMASK)
+    else:
+        file.save(image_path)
+    _invalidate_upload_index()
     return image_path
 
 
-def _extract_meta_content(text: str, name: str) -> str | None:
-    pattern = rf'<meta[^>]+(?:property|name)=["\']{re.escape(name)}["\'][^>]+content=["\']([^"\']+)["\']'
-    match = re.search(pattern, text, re.IGNORECASE)
-    if match:
-        return html.unescape(match.group(1))
-    return None
+_META_TAG_RE = re.compile(r"<meta\b[^>]*>", re.IGNORECASE)
+_TAG_ATTR_RE = re.compile(r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+_IMAGE_META_KEYS = ("og:image:secure_url", "og:image", "twitter:image:src", "twitter:image")
 
 
-def _extract_image_url_from_html(text: str) -> str | None:
-    patterns = [
-        r'<meta[^>]+property=["\']og:image:secure_url["\'][^>]+content=["\']([^"\']+)["\']',
-        r'<meta[^>]+property=["\']og:image["\'][^>]+content=["\']([^"\']+)["\']',
-        r'<meta[^>]+name=["\']twitter:image:src["\'][^>]+content=["\']([^"\']+)["\']',
-        r'<meta[^>]+name=["\']twitter:image["\'][^>]+content=["\']([^"\']+)["\']',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            return html.unescape(match.group(1))
+def _parse_meta(text: str) -> dict[str, str]:
+    meta: dict[str, str] = {}
+    for tag in _META_TAG_RE.finditer(text):
+        attrs = {
+            match.group(1).lower(): match.group(2) if match.group(2) is not None else match.group(3)
+            for match in _TAG_ATTR_RE.finditer(tag.group(0))
+        }
+        key = attrs.get("property") or attrs.get("name")
+        content = attrs.get("content")
+        if key and content:
+            meta.setdefault(key.lower(), html.unescape(content))
+    return meta
+
+
+def _meta_image_url(meta: dict[str, str]) -> str | None:
+    for key in _IMAGE_META_KEYS:
+        if key in meta:
+            return meta[key]
     return None
 
 
-def _html_has_video_meta(text: str) -> bool:
-    og_type = _extract_meta_content(text, "og:type")
-    if og_type and "video" in og_type.lower():
-        return True
-    if re.search(r'property=["\']og:video', text, re.IGNORECASE):
+def _meta_has_video(meta: dict[str, str]) -> bool:
+    if "video" in meta.get("og:type", "").lower():
         return True
-    if re.search(r'name=["\']twitter:player', text, re.IGNORECASE):
-        return True
-    return False
+    return any(key.startswith(("og:video", "twitter:player")) for key in meta)
 
 
 def _instagram_post_info(url: str) -> tuple[str | None, str | None]:
-    parsed = urlparse(url)
-    host = parsed.netloc.lower().split(":")[0]
-    if not host.endswith("instagram.com"):
+    if not _url_host(url).endswith("instagram.com"):
         return None, None
-    parts = [part for part in parsed.path.split("/") if part]
+    parts = [part for part in _parse_url(url).path.split("/") if part]
     for idx, part in enumerate(parts[:-1]):
         if part in ("p", "reel", "tv"):
             return part, parts[idx + 1]
@@ -1539,7 +846,7 @@ def _instagram_media_url(shortcode: str) -> str:
 
 
 def _infer_source_type(url: str) -> str:
-    host = urlparse(url).netloc.lower().split(":")[0]
+    host = _url_host(url)
     if "instagram" in host:
         return "instagram"
     if "facebook" in host or "fbcdn.net" in host:
@@ -1548,8 +855,8 @@ def _infer_source_type(url: str) -> str:
 
 
 def _should_store_local_image(source_url: str, resolved_url: str) -> bool:
-    source_host = urlparse(source_url).netloc.lower()
-    resolved_host = urlparse(resolved_url).netloc.lower()
+    source_host = _url_host(source_url)
+    resolved_host = _url_host(resolved_url)
     if "instagram.com" in source_host:
         return True
     if "fbcdn.net" in resolved_host or "cdninstagram.com" in resolved_host:
@@ -1557,198 +864,350 @@ def _should_store_local_image(source_url: str, resolved_url: str) -> bool:
     return False
 
 
-def _prune_remote_downloads() -> None:
-    if REMOTE_CACHE_MAX_FILES <= 0:
+_REMOTE_CACHE: "OrderedDict[str, None] | None" = None
+_REMOTE_CACHE_LOCK = threading.Lock()
+
+
+def _remote_cache() -> "OrderedDict[str, None]":
+    # Seeded once from disk, oldest first; kept in LRU order afterwards.
+    global _REMOTE_CACHE
+    if _REMOTE_CACHE is None:
+        paths = []
+        try:
+            with os.scandir(UPLOAD_DIR) as entries:
+                for entry in entries:
+                    try:
+                        if "_remote" in entry.name and entry.is_file():
+                            paths.append((entry.stat().st_mtime, entry.name))
+                    except OSError:
+                        continue
+        except FileNotFoundError:
+            pass
+        _REMOTE_CACHE = OrderedDict((name, None) for _, name in sorted(paths))
+    return _REMOTE_CACHE
+
+
+def _release_remote_download(image_path: Path, source_url: str, store_local: bool) -> None:
+    if not source_url or image_path.parent != UPLOAD_DIR:
         return
-    if not UPLOAD_DIR.exists():
+    if not store_local and not KEEP_REMOTE_DOWNLOADS:
+        try:
+            image_path.unlink()
+        except OSError:
+            return
+        _invalidate_upload_index()
         return
-    candidates = sorted(
-        (path for path in UPLOAD_DIR.iterdir() if path.is_file() and "_remote" in path.name),
-        key=lambda path: path.stat().st_mtime,
-    )
-    excess = len(candidates) - REMOTE_CACHE_MAX_FILES
-    for path in candidates[:max(0, excess)]:
+    if REMOTE_CACHE_MAX_FILES <= 0:
+        return
+    with _REMOTE_CACHE_LOCK:
+        cache = _remote_cache()
+        cache[image_path.name] = None
+        cache.move_to_end(image_path.name)
+        evicted = []
+        while len(cache) > REMOTE_CACHE_MAX_FILES:
+            evicted.append(cache.popitem(last=False)[0])
+    for name in evicted:
         try:
-            path.unlink()
+            (UPLOAD_DIR / name).unlink()
         except OSError:
             continue
-
-
-def _write_image_response(response: requests.Response, url: str) -> Path:
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    if evicted:
+        _invalidate_upload_index()
+
+
+def _write_image_response(response: requests.Response, url: str) -> tuple[Path, str]:
+    # Remote images get the same size cap as uploads.
+    max_bytes = app.config["MAX_CONTENT_LENGTH"]
+    too_large = f"Image is larger than {max_bytes // (1024 * 1024)} MB."
+    declared = response.headers.get("Content-Length") or ""
+    if declared.isdigit() and int(declared) > max_bytes:
+        response.close()
+        raise ValueError(too_large)
+    timestamp = _file_timestamp()
     UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
     extension = _guess_extension(url, response.headers.get("Content-Type"))
     image_path = UPLOAD_DIR / f"{timestamp}_remote{extension}"
+    digest = hashlib.sha256()
+    written = 0
     with open(image_path, "wb") as f:
-        for chunk in response.iter_content(chunk_size=8192):
+        raw = getattr(response, "raw", None)
+        if raw is not None and hasattr(raw, "read"):
+            raw.decode_content = True
+            chunks = iter(lambda: raw.read(IO_CHUNK_SIZE), b"")
+        else:
+            chunks = response.iter_content(chunk_size=IO_CHUNK_SIZE)
+        for chunk in chunks:
             if chunk:
+                written += len(chunk)
+                if written > max_bytes:
+                    break
+                digest.update(chunk)
                 f.write(chunk)
-    return image_path
-
-
-def _fetch_html(url: str, headers: dict, use_jina: bool = False) -> str | None:
+    if written > max_bytes:
+        response.close()
+        image_path.unlink(missing_ok=True)
+        raise ValueError(too_large)
+    _invalidate_upload_index()
+    return image_path, digest.hexdigest()
+
+
+_HTTP_LOCAL = threading.local()
+_HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 13_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/*;q=0.8,*/*;q=0.7",
+}
+
+
+def _http() -> requests.Session:
+    # One keep-alive session per thread so follow-up fetches to the same host reuse TLS.
+    session = getattr(_HTTP_LOCAL, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(_HTTP_HEADERS)
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _HTTP_LOCAL.session = session
+    return session
+
+
+def _fetch_html(url: str, use_jina: bool = False) -> str | None:
     request_url = url
     if use_jina:
         if url.startswith("https://"):
             request_url = f"https://r.jina.ai/https://{url[len('https://'):]}"
         elif url.startswith("http://"):
             request_url = f"https://r.jina.ai/http://{url[len('http://'):]}"
-    extra_headers = dict(headers)
+    extra_headers = {}
     if use_jina:
         jina_key = os.getenv("JINA_API_KEY")
         if jina_key:
             extra_headers["Authorization"] = f"Bearer {jina_key}"
-    response = requests.get(request_url, timeout=20, headers=extra_headers)
-    if response.status_code >= 400:
-        return None
-    return response.text
+    http = _http()
+    http.cookies.clear()
+    with http.get(request_url, timeout=20, headers=extra_headers) as response:
+        if response.status_code >= 400:
+            return None
+        return response.text
+
+
+_PLAYWRIGHT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playwright")
+# Playwright's sync API is tied to the thread that started it, so the shared
+# browser lives on the single executor thread and is only touched from there.
+_PLAYWRIGHT: dict = {}
+
+
+def _launch_playwright_browser():
+    if "driver" not in _PLAYWRIGHT:
+        from playwright.sync_api import sync_playwright
+
+        _PLAYWRIGHT["driver"] = sync_playwright().start()
+    browser = _PLAYWRIGHT["driver"].chromium.launch(headless=True)
+    _PLAYWRIGHT["browser"] = browser
+    return browser
+
+
+def _reset_playwright() -> None:
+    _PLAYWRIGHT.pop("browser", None)
+    driver = _PLAYWRIGHT.pop("driver", None)
+    if driver is not None:
+        try:
+            driver.stop()
+        except Exception:
+            pass
+
+
+def _playwright_browser():
+    browser = _PLAYWRIGHT.get("browser")
+    if browser is not None and browser.is_connected():
+        return browser
+    try:
+        return _launch_playwright_browser()
+    except Exception:
+        # The cached driver may be dead; start a fresh one once rather than failing every later job.
+        _reset_playwright()
+        return _launch_playwright_browser()
 
 
 def _resolve_image_url_with_playwright(url: str) -> str | None:
     try:
-        from playwright.sync_api import sync_playwright
+        import playwright.sync_api  # noqa: F401
     except Exception:
         return None
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until="domcontentloaded", timeout=20000)
-            page.wait_for_timeout(1500)
-            meta_image = page.evaluate(
-                """
-                () => {
-                  const meta = (name) => {
-                    const el = document.querySelector(`meta[property='${name}']`) ||
-                               document.querySelector(`meta[name='${name}']`);
-                    return el ? el.getAttribute('content') : null;
-                  };
-                  return (
-                    meta('og:image:secure_url') ||
-                    meta('og:image') ||
-                    meta('twitter:image:src') ||
-                    meta('twitter:image')
-                  );
-                }
-                """
-            )
-            try:
-                page.wait_for_selector("article img", timeout=5000)
-            except Exception:
-                pass
-            images = page.evaluate(
-                """
-                () => {
-                  const nodes = Array.from(document.querySelectorAll('article img'));
-                  return nodes.map(img => ({
-                    src: img.currentSrc || img.src || null,
-                    srcset: img.getAttribute('srcset') || '',
-                    width: img.naturalWidth || 0,
-                    height: img.naturalHeight || 0
-                  }));
-                }
-                """
-            )
-            browser.close()
-            best_url = None
-            best_score = -1
-            for item in images or []:
-                src = item.get("src")
-                srcset = item.get("srcset") or ""
-                width = item.get("width") or 0
-                height = item.get("height") or 0
-                score = width * height
-                if srcset:
-                    for part in srcset.split(","):
-                        chunk = part.strip().split()
-                        if len(chunk) < 2:
-                            continue
-                        candidate = chunk[0]
-                        size = chunk[1].strip()
-                        if size.endswith("w"):
-                            try:
-                                w = int(size[:-1])
-                            except ValueError:
-                                continue
-                            if w * w > score:
-                                score = w * w
-                                src = candidate
-                        elif size.endswith("x"):
-                            try:
-                                scale = float(size[:-1])
-                            except ValueError:
-                                continue
-                            if scale > 1 and score > 0:
-                                score = int(score * scale * scale)
-                                src = candidate
-                if src and score > best_score:
-                    best_score = score
-                    best_url = src
-            return best_url or meta_image
+        return _PLAYWRIGHT_EXECUTOR.submit(_scrape_image_url_with_playwright, url).result(timeout=60)
     except Exception:
         return None
 
 
-def _download_image(url: str) -> tuple[Path, str]:
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 13_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/*;q=0.8,*/*;q=0.7",
-    }
+def _scrape_image_url_with_playwright(url: str) -> str | None:
+    context = _playwright_browser().new_context()
+    try:
+        page = context.new_page()
+        page.goto(url, wait_until="domcontentloaded", timeout=20000)
+        page.wait_for_timeout(1500)
+        meta_image = page.evaluate(
+            """
+            () => {
+              const meta = (name) => {
+                const el = document.querySelector(`meta[property='${name}']`) ||
+                           document.querySelector(`meta[name='${name}']`);
+                return el ? el.getAttribute('content') : null;
+              };
+              return (
+                meta('og:image:secure_url') ||
+                meta('og:image') ||
+                meta('twitter:image:src') ||
+                meta('twitter:image')
+              );
+            }
+            """
+        )
+        try:
+            page.wait_for_selector("article img", timeout=5000)
+        except Exception:
+            pass
+        # Score srcset candidates in the page so only the winning URL crosses the bridge.
+        best_url = page.evaluate(
+            """
+            () => {
+              let bestUrl = null;
+              let bestScore = -1;
+              for (const img of document.querySelectorAll('article img')) {
+                let src = img.currentSrc || img.src || null;
+                let score = (img.naturalWidth || 0) * (img.naturalHeight || 0);
+                for (const part of (img.getAttribute('srcset') || '').split(',')) {
+                  const chunk = part.trim().split(/\\s+/);
+                  if (chunk.length < 2) continue;
+                  const size = chunk[1];
+                  if (size.endsWith('w')) {
+                    if (!/^[+-]?\\d+$/.test(size.slice(0, -1))) continue;
+                    const w = parseInt(size, 10);
+                    if (w * w > score) {
+                      score = w * w;
+                      src = chunk[0];
+                    }
+                  } else if (size.endsWith('x')) {
+                    const scale = Number(size.slice(0, -1));
+                    if (scale > 1 && score > 0) {
+                      score = Math.trunc(score * scale * scale);
+                      src = chunk[0];
+                    }
+                  }
+                }
+                if (src && score > bestScore) {
+                  bestScore = score;
+                  bestUrl = src;
+                }
+              }
+              return bestUrl;
+            }
+            """
+        )
+        return best_url or meta_image
+    finally:
+        context.close()
+
+
+def _download_instagram_media(http: requests.Session, shortcode: str) -> tuple[Path, str, str] | None:
+    media_url = _instagram_media_url(shortcode)
+    with http.get(media_url, stream=True, timeout=20) as media_response:
+        media_type = (media_response.headers.get("Content-Type") or "").lower()
+        if media_response.status_code >= 400 or not media_type.startswith("image/"):
+            return None
+        resolved_url = media_response.url or media_url
+        image_path, image_hash = _write_image_response(media_response, resolved_url)
+    return image_path, resolved_url, image_hash
+
+
+def _download_image(url: str) -> tuple[Path, str, str]:
+    http = _http()
+    # Cookies may flow through a redirect chain, but never from one download to the next.
+    http.cookies.clear()
     post_type, shortcode = _instagram_post_info(url)
-    response = requests.get(url, stream=True, timeout=20, headers=headers)
-    if response.status_code >= 400:
+    with http.get(url, stream=True, timeout=20) as response:
+        status_code = response.status_code
+        content_type = (response.headers.get("Content-Type") or "").lower()
+        if status_code < 400 and content_type.startswith("image/"):
+            resolved_url = response.url or url
+            image_path, image_hash = _write_image_response(response, resolved_url)
+            return image_path, resolved_url, image_hash
+        page_text = response.text if status_code < 400 else ""
+
+    if status_code >= 400:
         if post_type in ("reel", "tv"):
             raise ValueError("Instagram reels/videos are not supported yet. Please use a static image.")
         if post_type == "p" and shortcode:
-            media_url = _instagram_media_url(shortcode)
-            media_response = requests.get(media_url, stream=True, timeout=20, headers=headers)
-            if media_response.status_code < 400:
-                media_type = (media_response.headers.get("Content-Type") or "").lower()
-                if media_type.startswith("image/"):
-                    resolved_url = media_response.url or media_url
-                    return _write_image_response(media_response, resolved_url), resolved_url
-        raise ValueError(f"Failed to download image: {response.status_code}")
-
-    content_type = (response.headers.get("Content-Type") or "").lower()
-    if content_type.startswith("image/"):
-        resolved_url = response.url or url
-        return _write_image_response(response, resolved_url), resolved_url
-
-    text = response.text or ""
-    if post_type in ("reel", "tv") or (post_type and _html_has_video_meta(text)):
+            downloaded = _download_instagram_media(http, shortcode)
+            if downloaded:
+                return downloaded
+        raise ValueError(f"Failed to download image: {status_code}")
+
+    meta = _parse_meta(page_text or "")
+    if post_type in ("reel", "tv") or (post_type and _meta_has_video(meta)):
         raise ValueError("Instagram reels/videos are not supported yet. Please use a static image.")
 
     if post_type == "p" and shortcode:
-        media_url = _instagram_media_url(shortcode)
-        media_response = requests.get(media_url, stream=True, timeout=20, headers=headers)
-        if media_response.status_code < 400:
-            media_type = (media_response.headers.get("Content-Type") or "").lower()
-            if media_type.startswith("image/"):
-                resolved_url = media_response.url or media_url
-                return _write_image_response(media_response, resolved_url), resolved_url
-
-    image_url = _extract_image_url_from_html(text)
+        downloaded = _download_instagram_media(http, shortcode)
+        if downloaded:
+            return downloaded
+
+    image_url = _meta_image_url(meta)
     if not image_url:
-        jina_text = _fetch_html(url, headers, use_jina=True)
+        jina_text = _fetch_html(url, use_jina=True)
         if jina_text:
-            image_url = _extract_image_url_from_html(jina_text)
+            image_url = _meta_image_url(_parse_meta(jina_text))
     if not image_url:
         image_url = _resolve_image_url_with_playwright(url)
     if image_url and image_url != url:
-        image_response = requests.get(image_url, stream=True, timeout=20, headers=headers)
-        if image_response.status_code >= 400:
-            raise ValueError(f"Failed to download image from page: {image_response.status_code}")
-        image_type = (image_response.headers.get("Content-Type") or "").lower()
-        if not image_type.startswith("image/"):
-            raise ValueError("Page did not contain a usable image link.")
-        return _write_image_response(image_response, image_url), image_url
+        with http.get(image_url, stream=True, timeout=20) as image_response:
+            if image_response.status_code >= 400:
+                raise ValueError(f"Failed to download image from page: {image_response.status_code}")
+            image_type = (image_response.headers.get("Content-Type") or "").lower()
+            if not image_type.startswith("image/"):
+                raise ValueError("Page did not contain a usable image link.")
+            image_path, image_hash = _write_image_response(image_response, image_url)
+        return image_path, image_url, image_hash
 
     raise ValueError("URL did not point to an image. Use a direct image link or a public post URL.")
 
 
 @app.get("/uploads/<path:filename>")
 def uploads(filename: str):
-    return send_from_directory(UPLOAD_DIR, filename)
+    if USE_XACCEL:
+        # Let the fronting nginx stream the file from an internal location.
+        path = safe_join(str(UPLOAD_DIR), filename)
+        if path is None or not os.path.isfile(path):
+            abort(404)
+        response = Response(mimetype=mimetypes.guess_type(path)[0] or "application/octet-stream")
+        response.headers["X-Accel-Redirect"] = XACCEL_UPLOAD_PREFIX.rstrip("/") + "/" + filename
+        response.cache_control.max_age = app.config["SEND_FILE_MAX_AGE_DEFAULT"]
+        response.cache_control.public = True
+        return response
+    return send_from_directory(UPLOAD_DIR, filename, conditional=True)
+
+
+_UPLOAD_INDEX: tuple[float, frozenset[str]] = (0.0, frozenset())
+
+
+def _invalidate_upload_index() -> None:
+    global _UPLOAD_INDEX
+    _UPLOAD_INDEX = (0.0, frozenset())
+
+
+def _upload_exists(name: str) -> bool:
+    # Listing the directory every few seconds beats a stat per rendered card.
+    global _UPLOAD_INDEX
+    loaded_at, names = _UPLOAD_INDEX
+    now = time.monotonic()
+    if not loaded_at or now - loaded_at > UPLOAD_INDEX_TTL:
+        try:
+            with os.scandir(UPLOAD_DIR) as entries:
+                names = frozenset(entry.name for entry in entries if entry.is_file())
+        except OSError:
+            names = frozenset()
+        _UPLOAD_INDEX = (now, names)
+    return name in names
 
 
 def _image_src(image_url: str | None) -> str:
@@ -1756,32 +1215,30 @@ def _image_src(image_url: str | None) -> str:
         return ""
     if image_url.startswith("http://") or image_url.startswith("https://"):
         return image_url
-    try:
-        path = Path(image_url)
-        if path.is_file() and path.parent == UPLOAD_DIR:
-            return f"/uploads/{path.name}"
-    except OSError:
-        return ""
+    parent, name = os.path.split(image_url)
+    if parent == str(UPLOAD_DIR) and _upload_exists(name):
+        return f"/uploads/{name}"
     return ""
 
 
+@lru_cache(maxsize=4096, typed=True)
 def _esc(value: object) -> str:
-    return html.escape("" if value is None else str(value), quote=True)
+    if value is None:
+        return ""
+    return html.escape(value if type(value) is str else str(value), quote=True)
 
 
 def _now() -> str:
     return datetime.utcnow().isoformat(timespec="seconds") + "Z"
 
 
+@lru_cache(maxsize=4096)
 def _format_location(venue: str | None, city: str | None, province: str | None) -> str:
-    parts = []
-    for value in (venue, city, province):
-        if not value:
-            continue
-        if value in parts:
-            continue
-        parts.append(value)
-    return " - ".join(parts)
+    if city == venue:
+        city = None
+    if province == venue or province == city:
+        province = None
+    return " - ".join([value for value in (venue, city, province) if value])
 
 
 def _row_value(row: object, key: str) -> object:
@@ -1795,7 +1252,7 @@ def _row_value(row: object, key: str) -> object:
 
 def _extract_instagram_shortcode(url: str) -> str | None:
     try:
-        parts = [part for part in urlparse(url).path.split("/") if part]
+        parts = [part for part in _parse_url(url).path.split("/") if part]
     except Exception:
         return None
     for idx, part in enumerate(parts):
@@ -1806,15 +1263,58 @@ def _extract_instagram_shortcode(url: str) -> str | None:
 
 def _hash_file(path: Path) -> str | None:
     try:
-        digest = hashlib.sha256()
         with path.open("rb") as handle:
-            for chunk in iter(lambda: handle.read(8192), b""):
-                digest.update(chunk)
-        return digest.hexdigest()
+            if os.fstat(handle.fileno()).st_size >= HASH_MMAP_MIN_SIZE:
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return hashlib.sha256(mapped).hexdigest()
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(handle, "sha256").hexdigest()
+            digest = hashlib.sha256()
+            buffer = bytearray(IO_CHUNK_SIZE)
+            view = memoryview(buffer)
+            while size := handle.readinto(buffer):
+                digest.update(view[:size])
+            return digest.hexdigest()
     except OSError:
         return None
 
 
+# Newest poster matching the post id, else the source URL, else the image hash.
+_EXISTING_POSTER_SQL = """
+    SELECT id, created_at, tour_name, source_month, artist_name
+    FROM (
+        SELECT * FROM (
+            SELECT 1 AS priority, p.id, p.created_at, p.tour_name, p.source_month, a.name AS artist_name
+            FROM posters p
+            JOIN artists a ON a.id = p.artist_id
+            WHERE p.source_post_id = :post_id
+            ORDER BY p.created_at DESC
+            LIMIT 1
+        )
+        UNION ALL
+        SELECT * FROM (
+            SELECT 2, p.id, p.created_at, p.tour_name, p.source_month, a.name
+            FROM posters p
+            JOIN artists a ON a.id = p.artist_id
+            WHERE p.source_url = :url
+            ORDER BY p.created_at DESC
+            LIMIT 1
+        )
+        UNION ALL
+        SELECT * FROM (
+            SELECT 3, p.id, p.created_at, p.tour_name, p.source_month, a.name
+            FROM posters p
+            JOIN artists a ON a.id = p.artist_id
+            WHERE p.image_hash = :hash
+            ORDER BY p.created_at DESC
+            LIMIT 1
+        )
+    )
+    ORDER BY priority
+    LIMIT 1
+"""
+
+
 def _find_existing_poster(
     source_post_id: str | None,
     source_url: str | None,
@@ -1822,123 +1322,70 @@ def _find_existing_poster(
 ):
     if not DB_PATH.exists():
         return None
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row
-    try:
-        if source_post_id:
-            row = conn.execute(
-                """
-                SELECT p.id, p.created_at, p.tour_name, p.source_month, a.name AS artist_name
-                FROM posters p
-                JOIN artists a ON a.id = p.artist_id
-                WHERE p.source_post_id = ?
-                ORDER BY p.created_at DESC
-                LIMIT 1
-                """,
-                (source_post_id,),
-            ).fetchone()
-            if row:
-                return row
-        if source_url:
-            row = conn.execute(
-                """
-                SELECT p.id, p.created_at, p.tour_name, p.source_month, a.name AS artist_name
-                FROM posters p
-                JOIN artists a ON a.id = p.artist_id
-                WHERE p.source_url = ?
-                ORDER BY p.created_at DESC
-                LIMIT 1
-                """,
-                (source_url,),
-            ).fetchone()
-            if row:
-                return row
-        if image_hash:
-            row = conn.execute(
-                """
-                SELECT p.id, p.created_at, p.tour_name, p.source_month, a.name AS artist_name
-                FROM posters p
-                JOIN artists a ON a.id = p.artist_id
-                WHERE p.image_hash = ?
-                ORDER BY p.created_at DESC
-                LIMIT 1
-                """,
-                (image_hash,),
-            ).fetchone()
-            if row:
-                return row
-    finally:
-        conn.close()
-    return None
-
-
-def _poster_dedupe_key(row: dict) -> str:
-    return (
-        row.get("source_post_id")
-        or row.get("source_url")
-        or row.get("image_hash")
-        or row["id"]
-    )
+    if not (source_post_id or source_url or image_hash):
+        return None
+    return _db().execute(
+        _EXISTING_POSTER_SQL,
+        {"post_id": source_post_id or None, "url": source_url or None, "hash": image_hash or None},
+    ).fetchone()
 
 
-def _dedupe_posters(rows: list[dict]) -> tuple[list[dict], int]:
-    buckets: dict[str, dict] = {}
+def _dedupe_posters(rows: list[sqlite3.Row]) -> tuple[list[dict], int]:
+    # Keep the newest poster per post id / source URL / image hash, counting versions.
+    best: dict[str, list] = {}
     for row in rows:
-        key = _poster_dedupe_key(row)
-        entry = buckets.get(key)
-        if not entry:
-            buckets[key] = {"row": row, "count": 1}
+        key = row["source_post_id"] or row["source_url"] or row["image_hash"] or row["id"]
+        slot = best.get(key)
+        if slot is None:
+            best[key] = [row, 1]
             continue
-        entry["count"] += 1
-        if (row.get("created_at") or "") > (entry["row"].get("created_at") or ""):
-            entry["row"] = row
-
-    deduped = []
-    for entry in buckets.values():
-        item = dict(entry["row"])
-        item["version_count"] = entry["count"]
-        deduped.append(item)
-
-    deduped.sort(key=lambda r: r.get("created_at") or "", reverse=True)
-    hidden_count = max(len(rows) - len(deduped), 0)
-    return deduped, hidden_count
-
-
-def _missing_fields(row: object) -> list[str]:
-    location_type = _row_value(row, "location_type") or "public"
-    if str(location_type).lower() in {"internal", "private"}:
-        return []
-    missing = []
-    if not _row_value(row, "venue"):
-        missing.append("venue")
-    if not _row_value(row, "city"):
-        missing.append("city")
-    if not _row_value(row, "province"):
-        missing.append("province")
-    return missing
-
-
-def _review_url(poster_id: str, show_all: bool, missing: str | None) -> str:
-    params = []
-    if show_all:
-        params.append("show=all")
-    if missing:
-        params.append(f"missing={missing}")
-    query = f"?{'&'.join(params)}" if params else ""
-    return f"/review/{poster_id}{query}"
-
-
-def _required_class(value: str | None, required: bool) -> str:
-    if not required:
-        return ""
-    return " required" if not value else ""
-
-
-def _required_hint(value: str | None, required: bool) -> str:
-    if not required:
-        return '<div class="field-hint warn" data-required-hint style="display:none;">Required for approval.</div>'
-    style = "" if not value else ' style="display:none;"'
-    return f'<div class="field-hint warn" data-required-hint{style}>Required for approval.</div>'
+        slot[1] += 1
+        if (row["created_at"] or "") > (slot[0]["created_at"] or ""):
+            slot[0] = row
+
+    deduped = [{**row, "version_count": count} for row, count in best.values()]
+    deduped.sort(key=lambda item: item["created_at"] or "", reverse=True)
+    return deduped, len(rows) - len(deduped)
+
+
+_MISSING_KEYS = ("venue", "city", "province")
+_MISSING_BITS = {key: 1 << index for index, key in enumerate(_MISSING_KEYS)}
+# Field names and chip markup for every missing-field bitmask.
+_MISSING_NAMES = tuple(
+    tuple(key for key in _MISSING_KEYS if mask & _MISSING_BITS[key]) for mask in range(1 << len(_MISSING_KEYS))
+)
+_MISSING_CHIPS = tuple(
+    '<div class="missing-chips">'
+    + "".join(f'<span class="chip warn">{key.title()}</span>' for key in names)
+    + "</div>"
+    if names
+    else ""
+    for names in _MISSING_NAMES
+)
+_MISSING_SUMMARIES = tuple(
+    '<div class="missing-summary"><span class="filter-label">Missing</span>'
+    + "".join(f'<span class="chip warn">{key.title()}</span>' for key in names)
+    + "</div>"
+    if names
+    else ""
+    for names in _MISSING_NAMES
+)
+
+
+def _missing_mask(location_type: object, venue: object, city: object, province: object) -> int:
+    if str(location_type or "public").lower() in {"internal", "private"}:
+        return 0
+    return (0 if venue else 1) | (0 if city else 2) | (0 if province else 4)
+
+
+_EDITOR_FIELDS = ("date", "event_name", "venue", "city", "province", "time", "ticket_info", "status")
+# Indexed by "field is required and still empty".
+_REQUIRED_CLASSES = ("", " required")
+_REQUIRED_HINTS = (
+    '<div class="field-hint warn" data-required-hint style="display:none;">Required for approval.</div>',
+    '<div class="field-hint warn" data-required-hint>Required for approval.</div>',
+)
+_INTERNAL_NOTE = '<div class="missing-summary"><span class="pill soft">Internal event</span></div>'
 
 
 def _event_editor(
@@ -1955,31 +1402,29 @@ def _event_editor(
         or "Untitled event"
     )
 
-    def _val(key: str) -> str:
-        value = _row_value(event, key)
-        return "" if value is None else str(value)
+    raw = {key: _row_value(event, key) for key in _EDITOR_FIELDS}
+    value = {key: "" if item is None else str(item) for key, item in raw.items()}
+    escaped = {key: _esc(item) for key, item in value.items()}
 
-    location_type = (_val("location_type") or "public").lower()
+    location_type = str(_row_value(event, "location_type") or "public").lower()
+    is_internal = location_type in {"internal", "private"}
     conf_value = _row_value(event, "confidence")
     conf_score = conf_value if isinstance(conf_value, (int, float)) else None
     conf_pill = _confidence_pill(conf_score)
-    missing_fields = _missing_fields(event)
-    missing_summary = ""
-    if missing_fields:
-        chips = "".join(
-            f'<span class="chip warn">{_esc(field.title())}</span>'
-            for field in missing_fields
-        )
-        missing_summary = f'<div class="missing-summary"><span class="filter-label">Missing</span>{chips}</div>'
-    location_note = ""
-    if location_type in {"internal", "private"}:
-        location_note = '<div class="missing-summary"><span class="pill soft">Internal event</span></div>'
-    if not missing_summary and location_note:
-        missing_summary = location_note
+    missing_summary = _MISSING_SUMMARIES[
+        _missing_mask(location_type, raw["venue"], raw["city"], raw["province"])
+    ]
+    if not missing_summary and is_internal:
+        missing_summary = _INTERNAL_NOTE
 
     form_id_attr = f' id="{form_id}"' if form_id else ""
     event_id = _row_value(event, "id") or ""
-    requires_location = location_type not in {"internal", "private"}
+    requires_location = not is_internal
+    date_flag = not value["date"]
+    venue_flag = requires_location and not value["venue"]
+    city_flag = requires_location and not value["city"]
+    province_flag = requires_location and not value["province"]
+    status = value["status"]
 
     return f"""
       <{heading_tag} id="event-title">{_esc(title)}</{heading_tag}>
@@ -1990,52 +1435,52 @@ def _event_editor(
       <form method="post"{form_id_attr} action="/event/{_esc(str(event_id))}">
         <input type="hidden" name="poster_id" value="{_esc(poster_id)}">
         <input type="hidden" name="return" value="{_esc(return_url)}">
-        <div class="field{_required_class(_val('date'), True)}" data-required-field="date" data-required-scope="always">
+        <div class="field{_REQUIRED_CLASSES[date_flag]}" data-required-field="date" data-required-scope="always">
           <label>Date<span class="req">*</span></label>
-          <input name="date" value="{_esc(_val('date'))}">
-          {_required_hint(_val('date'), True)}
+          <input name="date" value="{escaped["date"]}">
+          {_REQUIRED_HINTS[date_flag]}
         </div>
         <div class="field">
           <label>Event name</label>
-          <input name="event_name" value="{_esc(_val('event_name'))}">
+          <input name="event_name" value="{escaped["event_name"]}">
         </div>
         <div class="field">
           <label>Location type</label>
           <select name="location_type">
             <option value="public" {"selected" if location_type == "public" else ""}>Public venue (required)</option>
-            <option value="internal" {"selected" if location_type in {"internal", "private"} else ""}>Internal / no public venue</option>
+            <option value="internal" {"selected" if is_internal else ""}>Internal / no public venue</option>
           </select>
           <div class="hint">Choose internal for private shows without venue, city, or province.</div>
         </div>
-        <div class="field{_required_class(_val('venue'), requires_location)}" data-required-field="venue" data-required-scope="location">
+        <div class="field{_REQUIRED_CLASSES[venue_flag]}" data-required-field="venue" data-required-scope="location">
           <label>Venue<span class="req">*</span></label>
-          <input name="venue" value="{_esc(_val('venue'))}">
-          {_required_hint(_val('venue'), requires_location)}
+          <input name="venue" value="{escaped["venue"]}">
+          {_REQUIRED_HINTS[venue_flag]}
         </div>
-        <div class="field{_required_class(_val('city'), requires_location)}" data-required-field="city" data-required-scope="location">
+        <div class="field{_REQUIRED_CLASSES[city_flag]}" data-required-field="city" data-required-scope="location">
           <label>City<span class="req">*</span></label>
-          <input name="city" value="{_esc(_val('city'))}">
-          {_required_hint(_val('city'), requires_location)}
+          <input name="city" value="{escaped["city"]}">
+          {_REQUIRED_HINTS[city_flag]}
         </div>
-        <div class="field{_required_class(_val('province'), requires_location)}" data-required-field="province" data-required-scope="location">
+        <div class="field{_REQUIRED_CLASSES[province_flag]}" data-required-field="province" data-required-scope="location">
           <label>Province<span class="req">*</span></label>
-          <input name="province" value="{_esc(_val('province'))}">
-          {_required_hint(_val('province'), requires_location)}
+          <input name="province" value="{escaped["province"]}">
+          {_REQUIRED_HINTS[province_flag]}
         </div>
         <div class="field">
           <label>Time</label>
-          <input name="time" value="{_esc(_val('time'))}" placeholder="19:00">
+          <input name="time" value="{escaped["time"]}" placeholder="19:00">
         </div>
         <div class="field">
           <label>Ticket info</label>
-          <input name="ticket_info" value="{_esc(_val('ticket_info'))}">
+          <input name="ticket_info" value="{escaped["ticket_info"]}">
         </div>
         <div class="field">
           <label>Status</label>
           <select name="status">
-            <option value="active" {"selected" if _val('status') == "active" else ""}>active</option>
-            <option value="cancelled" {"selected" if _val('status') == "cancelled" else ""}>cancelled</option>
-            <option value="postponed" {"selected" if _val('status') == "postponed" else ""}>postponed</option>
+            <option value="active" {"selected" if status == "active" else ""}>active</option>
+            <option value="cancelled" {"selected" if status == "cancelled" else ""}>cancelled</option>
+            <option value="postponed" {"selected" if status == "postponed" else ""}>postponed</option>
           </select>
         </div>
         <div class="edit-actions">
@@ -2069,6 +1514,7 @@ def _confidence_class(score: float) -> str:
     return "status-bad"
 
 
+@lru_cache(maxsize=4096)
 def _confidence_badge(score: float | None) -> str:
     if score is None:
         return ""
@@ -2077,6 +1523,7 @@ def _confidence_badge(score: float | None) -> str:
     return f'<span class="badge conf {klass}">{label}</span>'
 
 
+@lru_cache(maxsize=4096)
 def _confidence_pill(score: float | None) -> str:
     if score is None:
         return ""
@@ -2085,6 +1532,10 @@ def _confidence_pill(score: float | None) -> str:
     return f'<span class="pill {klass}">conf {label}</span>'
 
 
+_MONTH_ABBR = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+@lru_cache(maxsize=4096)
 def _format_datetime(value: str) -> str:
     try:
         cleaned = value.replace("Z", "")
@@ -2094,14 +1545,40 @@ def _format_datetime(value: str) -> str:
         return value
 
 
+@lru_cache(maxsize=4096)
 def _format_event_date(value: str) -> str:
     try:
+        if len(value) == 10 and value[4] == "-" and value[7] == "-":
+            # Stored dates are normalized YYYY-MM-DD; the constructor only validates them.
+            month = int(value[5:7])
+            datetime(int(value[:4]), month, int(value[8:10]))
+            return f"{_MONTH_ABBR[month - 1]} {value[8:10]}"
         dt = datetime.strptime(value, "%Y-%m-%d")
         return dt.strftime("%b %d")
     except Exception:
         return value
 
 
+_POSTER_CARD = """
+            <a class="poster-card" href="/poster/{poster_id}">
+              <div class="poster-thumb">{thumb}</div>
+              <div class="poster-meta">
+                <h3>{artist}</h3>
+                <div class="meta-row">
+                  <span>{tour}</span>
+                </div>
+                <div class="meta-row" style="margin-top: 6px;">
+                  <span class="pill">{source_month}</span>
+                  <span class="pill accent">{event_count} events</span>
+                  <span class="pill {status_class}">{status_label}</span>
+                  {version_pill}
+                  <span>{created}</span>
+                </div>
+              </div>
+            </a>
+            """
+
+
 @app.get("/db")
 def db_view() -> str:
     show_all = request.args.get("show") == "all"
@@ -2129,12 +1606,11 @@ def db_view() -> str:
             """
         )
 
-    posters_dicts = [dict(row) for row in posters_rows]
     hidden_count = 0
     if show_all:
-        posters = posters_dicts
+        posters = [dict(row) for row in posters_rows]
     else:
-        posters, hidden_count = _dedupe_posters(posters_dicts)
+        posters, hidden_count = _dedupe_posters(posters_rows)
 
     cards = []
     for row in posters:
@@ -2157,24 +1633,18 @@ def db_view() -> str:
         )
 
         cards.append(
-            f"""
-            <a class="poster-card" href="/poster/{row['id']}">
-              <div class="poster-thumb">{thumb}</div>
-              <div class="poster-meta">
-                <h3>{_esc(row['artist_name'])}</h3>
-                <div class="meta-row">
-                  <span>{_esc(row['tour_name'] or 'Untitled tour')}</span>
-                </div>
-                <div class="meta-row" style="margin-top: 6px;">
-                  <span class="pill">{_esc(row['source_month'])}</span>
-                  <span class="pill accent">{event_count} events</span>
-                  <span class="pill {status_class}">{status_label}</span>
-                  {version_pill}
-                  <span>{_esc(_format_datetime(row['created_at']))}</span>
-                </div>
-              </div>
-            </a>
-            """
+            _POSTER_CARD.format(
+                poster_id=row["id"],
+                thumb=thumb,
+                artist=_esc(row["artist_name"]),
+                tour=_esc(row["tour_name"] or "Untitled tour"),
+                source_month=_esc(row["source_month"]),
+                event_count=event_count,
+                status_class=status_class,
+                status_label=status_label,
+                version_pill=version_pill,
+                created=_esc(_format_datetime(row["created_at"])),
+            )
         )
 
     return _render_page(
@@ -2208,33 +1678,24 @@ def db_view() -> str:
     )
 
 
+_POSTER_NOT_FOUND_PAGE = _message_page(
+    "Poster details",
+    "/db",
+    "Back to library",
+    "Poster not found",
+    "We could not locate this poster in the local database.",
+).encode()
+
+
 @app.get("/poster/<poster_id>")
-def poster_view(poster_id: str) -> str:
-    poster = _fetch_poster(poster_id)
+def poster_view(poster_id: str) -> str | bytes:
+    poster, events = _fetch_poster_with_events(poster_id)
     if not poster:
-        return _render_page(
-            """
-            <header class="topbar">
-              <div class="brand">
-                <div class="logo">AC</div>
-                <div>
-                  <div class="brand-title">Artist Calendar</div>
-                  <div class="brand-sub">Poster details</div>
-                </div>
-              </div>
-              <a class="button ghost" href="/db">Back to library</a>
-            </header>
-            <div class="card">
-              <h2>Poster not found</h2>
-              <p>We could not locate this poster in the local database.</p>
-            </div>
-            """
-        )
+        return _POSTER_NOT_FOUND_PAGE
 
-    events = _fetch_events(poster_id)
-    pending_count = sum(1 for row in events if row["review_status"] == "pending")
-    approved_count = sum(1 for row in events if row["review_status"] == "approved")
-    rejected_count = sum(1 for row in events if row["review_status"] == "rejected")
+    pending_count = poster["pending_count"]
+    approved_count = poster["approved_count"]
+    rejected_count = poster["rejected_count"]
     status_label, status_class = _poster_status(len(events), pending_count, rejected_count)
     poster_conf_pill = _confidence_pill(poster["poster_confidence"])
     source_url_value = poster["source_url"]
@@ -2257,15 +1718,9 @@ def poster_view(poster_id: str) -> str:
             location = "Internal event"
         else:
             location = _format_location(row["venue"], row["city"], row["province"])
-        missing_fields = _missing_fields(row)
-        missing_class = " has-missing" if missing_fields else ""
-        missing_chips = ""
-        if missing_fields:
-            chips = "".join(
-                f'<span class="chip warn">{_esc(field.title())}</span>'
-                for field in missing_fields
-            )
-            missing_chips = f'<div class="missing-chips">{chips}</div>'
+        missing = _missing_mask(row["location_type"], row["venue"], row["city"], row["province"])
+        missing_class = " has-missing" if missing else ""
+        missing_chips = _MISSING_CHIPS[missing]
         status = row["review_status"] or "pending"
         event_status_class = status if status in {"approved", "rejected"} else "pending"
         conf_badge = _confidence_badge(row["confidence"])
@@ -2284,7 +1739,7 @@ def poster_view(poster_id: str) -> str:
             "status": row["status"] or "active",
             "review_status": row["review_status"] or "pending",
             "confidence": row["confidence"],
-            "missing_fields": missing_fields,
+            "missing_fields": _MISSING_NAMES[missing],
         }
 
         event_cards.append(
@@ -2331,17 +1786,7 @@ def poster_view(poster_id: str) -> str:
       <img src="{safe_image_src}" alt="poster preview" class="poster-peek-image" data-modal-open="poster-modal">
           </div>
         """
-        poster_modal_html = f"""
-        <div class="modal" id="poster-modal">
-          <div class="modal-content">
-            <div class="modal-header">
-              <strong>Poster</strong>
-              <button class="button ghost small" type="button" data-modal-close>Close</button>
-            </div>
-            <img src="{safe_image_src}" alt="poster" class="poster-image full">
-          </div>
-        </div>
-        """
+        poster_modal_html = _POSTER_MODAL.format(src=safe_image_src)
 
     if selected_event:
         detail_body = _event_editor(
@@ -2434,93 +1879,41 @@ def poster_view(poster_id: str) -> str:
     )
 
 
+_VIEW_POSTER_BUTTON = '<button class="button ghost" type="button" data-modal-open="poster-modal">View poster</button>'
+_EVENT_NOT_FOUND_PAGE = _message_page(
+    "Event review", "/db", "Back", "Event not found", "We could not locate this event in the local database."
+).encode()
+
+
 @app.route("/event/<event_id>", methods=["GET", "POST"])
-def update_event(event_id: str):
+def update_event(event_id: str) -> Response | str | bytes:
     if request.method == "POST":
-        action = request.form.get("action") or "save_pending"
-        poster_id = request.form.get("poster_id")
-        return_url = request.form.get("return") or (f"/review/{poster_id}" if poster_id else "/db")
+        form = request.form.to_dict()
+        action = form.get("action") or "save_pending"
+        poster_id = form.get("poster_id")
+        return_url = form.get("return") or (f"/review/{poster_id}" if poster_id else "/db")
         return_to_poster = bool(poster_id) and return_url.startswith(f"/poster/{poster_id}")
-        review_status = None
-        if action in {"approve", "approve_next"}:
-            review_status = "approved"
-        elif action == "reject":
-            review_status = "rejected"
-        elif action == "save_pending":
-            review_status = "pending"
-
-        fields = {}
-        for key in (
-            "date",
-            "event_name",
-            "venue",
-            "city",
-            "province",
-            "time",
-            "ticket_info",
-            "status",
-        ):
-            if key in request.form:
-                fields[key] = request.form.get(key)
+        review_status = _ACTION_REVIEW_STATUS.get(action)
+        fields = {key: form[key] for key in _EVENT_UPDATE_COLUMNS if key in form}
         _update_event(event_id, fields, review_status)
-        if poster_id and action == "approve_next":
-            next_id = _next_pending_event_id(poster_id, event_id)
-            if next_id:
-                if return_to_poster:
-                    return redirect(f"/poster/{poster_id}?event={next_id}")
-                return redirect(f"/event/{next_id}?return=/review/{poster_id}")
-            return redirect(return_url)
-
-        if poster_id and action == "approve":
+        next_url = _APPROVE_NEXT_URLS.get(action)
+        if poster_id and next_url:
             next_id = _next_pending_event_id(poster_id, event_id)
             if next_id:
                 if return_to_poster:
                     return redirect(f"/poster/{poster_id}?event={next_id}")
-                return redirect(f"/review/{poster_id}?focus={next_id}")
+                return redirect(next_url.format(poster_id=poster_id, next_id=next_id))
         return redirect(return_url)
 
-    event = _fetch_event(event_id)
+    event = _fetch_event_with_poster(event_id)
     if not event:
-        return _render_page(
-            """
-            <header class="topbar">
-              <div class="brand">
-                <div class="logo">AC</div>
-                <div>
-                  <div class="brand-title">Artist Calendar</div>
-                  <div class="brand-sub">Event review</div>
-                </div>
-              </div>
-              <a class="button ghost" href="/db">Back</a>
-            </header>
-            <div class="card">
-              <h2>Event not found</h2>
-              <p>We could not locate this event in the local database.</p>
-            </div>
-            """
-        )
+        return _EVENT_NOT_FOUND_PAGE
 
     poster_id = event["poster_id"]
-    poster = _fetch_poster(poster_id)
-    image_src = _image_src(poster["image_url"]) if poster else ""
-    image_html = ""
+    image_src = _image_src(event["poster_image_url"])
     modal_html = ""
     if image_src:
-        image_html = (
-            f"<img src=\"{image_src}\" alt=\"poster\" "
-            "style=\"width: 100%; max-width: 420px; border-radius: 16px;\">"
-        )
-        modal_html = f"""
-        <div class="modal" id="poster-modal">
-          <div class="modal-content">
-            <div class="modal-header">
-              <strong>Poster</strong>
-              <button class="button ghost small" type="button" data-modal-close>Close</button>
-            </div>
-            <img src="{image_src}" alt="poster" class="poster-image full">
-          </div>
-        </div>
-        """
+        modal_html = _POSTER_MODAL.format(src=image_src)
     return_url = request.args.get("return") or f"/review/{poster_id}"
     editor_html = _event_editor(
         event,
@@ -2529,26 +1922,22 @@ def update_event(event_id: str):
         heading_tag="h1",
     )
 
+    actions = (
+        '<div class="actions">'
+        f'<a class="button ghost" href="{_esc(return_url)}">Back</a>'
+        f"{_VIEW_POSTER_BUTTON if image_src else ''}"
+        "</div>"
+    )
     return _render_page(
-        f"""
-        <header class="topbar">
-          <div class="brand">
-            <div class="logo">AC</div>
-            <div>
-              <div class="brand-title">Artist Calendar</div>
-              <div class="brand-sub">Event review</div>
-            </div>
-          </div>
-          <div class="actions">
-            <a class="button ghost" href="{_esc(return_url)}">Back</a>
-            {'<button class="button ghost" type="button" data-modal-open="poster-modal">View poster</button>' if image_src else ''}
-          </div>
-        </header>
-        <div class="card">
-          {editor_html}
-        </div>
-        {modal_html}
-        """
+        "".join(
+            (
+                _topbar("Event review", actions),
+                '<div class="card">',
+                editor_html,
+                "</div>",
+                modal_html,
+            )
+        )
     )
 
 
@@ -2558,14 +1947,72 @@ def approve_all(poster_id: str):
     return redirect(f"/review/{poster_id}")
 
 
+_INGEST_EXECUTOR = ThreadPoolExecutor(max_workers=INGEST_WORKERS, thread_name_prefix="ingest")
+_INGEST_JOBS: "OrderedDict[str, Future]" = OrderedDict()
+_INGEST_JOBS_LOCK = threading.Lock()
+
+
+def _register_ingest_job(job_id: str, future: Future) -> None:
+    with _INGEST_JOBS_LOCK:
+        _INGEST_JOBS[job_id] = future
+        # Forget the oldest finished jobs; running ones are never dropped.
+        for old_id in list(_INGEST_JOBS):
+            if len(_INGEST_JOBS) <= INGEST_JOBS_MAX:
+                break
+            if _INGEST_JOBS[old_id].done():
+                del _INGEST_JOBS[old_id]
+
+
+def _run_ingest_job(
+    image_path: Path,
+    *,
+    image_url_for_db: str,
+    source_type: str,
+    source_url: str | None,
+    resolved_url: str | None,
+    source_post_id: str | None,
+    image_hash: str | None,
+    store_local: bool,
+) -> dict:
+    try:
+        data = image_to_structured(str(image_path))
+        if source_post_id and not data.get("source_post_id"):
+            data["source_post_id"] = source_post_id
+        if image_hash and not data.get("image_hash"):
+            data["image_hash"] = image_hash
+        if source_url:
+            data["source_image_url"] = resolved_url
+            data["source_image_path"] = str(image_path)
+        result = ingest_structured(
+            data,
+            db_path=DB_PATH,
+            image_url=image_url_for_db,
+            source_type=source_type,
+            source_url=source_url,
+            conn=_db(),
+        )
+        _invalidate_posters_cache()
+        return result
+    finally:
+        _release_remote_download(image_path, source_url, store_local)
+
+
+_MISSING_IMAGE_PAGE = _message_page(
+    "Upload error", "/", "Back", "Missing image", "Provide an image file or a valid image URL."
+).encode()
+_ALREADY_IMPORTED_TOPBAR = _topbar("Already imported", '<a class="button ghost" href="/">New upload</a>')
+
+
 @app.post("/ingest")
-def ingest() -> str:
+def ingest() -> Response | str | bytes:
     file = request.files.get("image")
     image_url_input = (request.form.get("image_url") or "").strip()
     store_local = False
     force_reextract = (request.form.get("force_reextract") or "").strip() == "1"
     source_post_id = None
+    image_path = None
     image_hash = None
+    existing = None
 
     if file and file.filename:
         image_path = _save_uploaded_file(file)
@@ -2573,63 +2020,30 @@ def ingest() -> str:
         source_url = None
         source_type = "manual"
     elif image_url_input:
-        try:
-            image_path, resolved_url = _download_image(image_url_input)
-            source_url = image_url_input
-            source_type = _infer_source_type(image_url_input)
-            store_local = _should_store_local_image(image_url_input, resolved_url)
-            image_url_for_db = str(image_path) if store_local else resolved_url
-            source_post_id = _extract_instagram_shortcode(image_url_input)
-        except Exception as exc:
-            return _render_page(
-                f"""
-                <header class="topbar">
-                  <div class="brand">
-                    <div class="logo">AC</div>
-                    <div>
-                      <div class="brand-title">Artist Calendar</div>
-                      <div class="brand-sub">Download failed</div>
-                    </div>
-                  </div>
-                  <a class="button ghost" href="/">Back</a>
-                </header>
-                <div class="card">
-                  <h2>Download failed</h2>
-                  <p>{exc}</p>
-                </div>
-                """
-            )
-    else:
-        return _render_page(
-            """
-            <header class="topbar">
-              <div class="brand">
-                <div class="logo">AC</div>
-                <div>
-                  <div class="brand-title">Artist Calendar</div>
-                  <div class="brand-sub">Upload error</div>
-                </div>
-              </div>
-              <a class="button ghost" href="/">Back</a>
-            </header>
-            <div class="card">
-              <h2>Missing image</h2>
-              <p>Provide an image file or a valid image URL.</p>
-            </div>
-            """
-        )
-
-    image_hash = _hash_file(image_path)
-    existing = _find_existing_poster(source_post_id, source_url, image_hash)
-    if existing and not force_reextract:
-        if store_local:
-            _prune_remote_downloads()
-        if source_url and not KEEP_REMOTE_DOWNLOADS and not store_local:
+        source_url = image_url_input
+        source_post_id = _extract_instagram_shortcode(image_url_input)
+        # A known shortcode or URL wins over the image hash, so check it before downloading.
+        if not force_reextract:
+            existing = _find_existing_poster(source_post_id, source_url, None)
+        if existing is None:
             try:
-                if image_path.exists() and image_path.parent == UPLOAD_DIR:
-                    image_path.unlink()
-            except OSError:
-                pass
+                image_path, resolved_url, image_hash = _download_image(image_url_input)
+                source_type = _infer_source_type(image_url_input)
+                store_local = _should_store_local_image(image_url_input, resolved_url)
+                image_url_for_db = str(image_path) if store_local else resolved_url
+            except Exception as exc:
+                return _message_page("Download failed", "/", "Back", "Download failed", str(exc))
+    else:
+        return _MISSING_IMAGE_PAGE
+
+    if existing is None:
+        if image_hash is None:
+            image_hash = _hash_file(image_path)
+        if not force_reextract:
+            existing = _find_existing_poster(None, None, image_hash)
+    if existing:
+        if image_path is not None:
+            _release_remote_download(image_path, source_url, store_local)
         source_label = _esc(existing["source_month"] or "unknown")
         tour_label = _esc(existing["tour_name"] or "Untitled tour")
         created_label = _esc(_format_datetime(existing["created_at"]))
@@ -2644,16 +2058,7 @@ def ingest() -> str:
             """
         return _render_page(
             f"""
-            <header class="topbar">
-              <div class="brand">
-                <div class="logo">AC</div>
-                <div>
-                  <div class="brand-title">Artist Calendar</div>
-                  <div class="brand-sub">Already imported</div>
-                </div>
-              </div>
-              <a class="button ghost" href="/">New upload</a>
-            </header>
+            {_ALREADY_IMPORTED_TOPBAR}
             <div class="card">
               <h2>This poster is already in your library</h2>
               <p><strong>{_esc(existing["artist_name"])}</strong> · {tour_label} · {source_label}</p>
@@ -2667,77 +2072,73 @@ def ingest() -> str:
             """
         )
 
-    try:
-        data = image_to_structured(str(image_path))
-        if source_post_id and not data.get("source_post_id"):
-            data["source_post_id"] = source_post_id
-        if image_hash and not data.get("image_hash"):
-            data["image_hash"] = image_hash
-        if source_url:
-            data["source_image_url"] = resolved_url
-            data["source_image_path"] = str(image_path)
-        summary = ingest_structured(
-            data,
-            db_path=DB_PATH,
-            image_url=image_url_for_db,
-            source_type=source_type,
-            source_url=source_url,
-        )
-    except Exception as exc:
-        return _render_page(
-            f"""
-            <header class="topbar">
-              <div class="brand">
-                <div class="logo">AC</div>
-                <div>
-                  <div class="brand-title">Artist Calendar</div>
-                  <div class="brand-sub">Ingest failed</div>
-                </div>
-              </div>
-              <a class="button ghost" href="/">Back</a>
-            </header>
-            <div class="card">
-              <h2>Ingest failed</h2>
-              <p>{exc}</p>
-            </div>
-            """
-        )
-    finally:
-        if store_local:
-            _prune_remote_downloads()
-        if source_url and not KEEP_REMOTE_DOWNLOADS and not store_local:
-            try:
-                if image_path.exists() and image_path.parent == UPLOAD_DIR:
-                    image_path.unlink()
-            except OSError:
-                pass
-
-    poster_id = summary.get("poster_id")
+    job_id = uuid.uuid4().hex
+    future = _INGEST_EXECUTOR.submit(
+        _run_ingest_job,
+        image_path,
+        image_url_for_db=image_url_for_db,
+        source_type=source_type,
+        source_url=source_url,
+        resolved_url=resolved_url if source_url else None,
+        source_post_id=source_post_id,
+        image_hash=image_hash,
+        store_local=store_local,
+    )
+    _register_ingest_job(job_id, future)
+    return redirect(f"/jobs/{job_id}")
+
+
+_JOB_NOT_FOUND_PAGE = _message_page(
+    "Import status",
+    "/",
+    "New upload",
+    "Import not found",
+    "This import is unknown or expired. Check the library for the poster.",
+    actions=_LIBRARY_LINK,
+).encode()
+_JOB_RUNNING_PAGE = _message_page(
+    "Importing poster",
+    "/",
+    "New upload",
+    "Extracting dates…",
+    "This can take up to 30 seconds. The page refreshes on its own.",
+    lead='<div class="spinner"></div>',
+    title="Importing poster",
+    refresh=2,
+).encode()
+_INGEST_COMPLETE_PAGE = _message_page(
+    "Ingest complete",
+    "/",
+    "New upload",
+    "Ingest complete",
+    "Poster saved, but no review page is available.",
+    actions=_LIBRARY_LINK,
+).encode()
+
+
+@app.get("/jobs/<job_id>")
+def ingest_job(job_id: str):
+    with _INGEST_JOBS_LOCK:
+        future = _INGEST_JOBS.get(job_id)
+    if future is None:
+        return _JOB_NOT_FOUND_PAGE, 404
+
+    if not future.done():
+        return _JOB_RUNNING_PAGE
+
+    exc = future.exception()
+    if exc is not None:
+        return _message_page("Ingest failed", "/", "Back", "Ingest failed", str(exc))
+
+    poster_id = future.result().get("poster_id")
     if poster_id:
         return redirect(f"/review/{poster_id}")
 
-    return _render_page(
-        """
-        <header class="topbar">
-          <div class="brand">
-            <div class="logo">AC</div>
-            <div>
-              <div class="brand-title">Artist Calendar</div>
-              <div class="brand-sub">Ingest complete</div>
-            </div>
-          </div>
-          <a class="button ghost" href="/">New upload</a>
-        </header>
-        <div class="card">
-          <h2>Ingest complete</h2>
-          <p>Poster saved, but no review page is available.</p>
-          <div class="actions">
-            <a class="button ghost" href="/db">Go to library</a>
-          </div>
-        </div>
-        """
-    )
+    return _INGEST_COMPLETE_PAGE
 
 
 if __name__ == "__main__":
-    app.run(host="127.0.0.1", port=5001, debug=True)
+    if serve is not None and not DEV_SERVER:
+        serve(app, host="127.0.0.1", port=5001, threads=SERVER_THREADS)
+    else:
+        app.run(host="127.0.0.1", port=5001, debug=DEV_SERVER, threaded=True)
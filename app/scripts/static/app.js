@@ -0,0 +1,302 @@
+document.addEventListener('DOMContentLoaded', () => {
+  const form = document.querySelector('form[data-import]');
+  const loading = document.getElementById('loading');
+  const status = document.getElementById('loading-status');
+  if (form && loading) {
+    form.addEventListener('submit', () => {
+      loading.style.display = 'flex';
+      if (status) {
+        const messages = [
+          'Downloading image…',
+          'Reading poster…',
+          'Extracting dates…',
+          'Saving to your library…'
+        ];
+        let index = 0;
+        status.textContent = messages[index];
+        setInterval(() => {
+          index = (index + 1) % messages.length;
+          status.textContent = messages[index];
+        }, 3500);
+      }
+    });
+  }
+
+  const openButtons = document.querySelectorAll('[data-modal-open]');
+  const closeButtons = document.querySelectorAll('[data-modal-close]');
+  openButtons.forEach((button) => {
+    button.addEventListener('click', () => {
+      const target = button.getAttribute('data-modal-open');
+      const modal = document.getElementById(target);
+      if (modal) {
+        modal.classList.add('active');
+      }
+    });
+  });
+  closeButtons.forEach((button) => {
+    button.addEventListener('click', () => {
+      const modal = button.closest('.modal');
+      if (modal) {
+        modal.classList.remove('active');
+      }
+    });
+  });
+  document.querySelectorAll('.modal').forEach((modal) => {
+    modal.addEventListener('click', (event) => {
+      if (event.target === modal) {
+        modal.classList.remove('active');
+      }
+    });
+  });
+
+  const applyLocationRequirement = (form, locationType) => {
+    const requiredFields = form.querySelectorAll('[data-required-field]');
+    if (!requiredFields.length) return;
+    const normalized = (locationType || 'public').toLowerCase();
+    const requiresLocation = normalized !== 'internal' && normalized !== 'private';
+    requiredFields.forEach((wrapper) => {
+      const key = wrapper.getAttribute('data-required-field');
+      if (!key) return;
+      const scope = wrapper.getAttribute('data-required-scope') || 'always';
+      const required = scope === 'always' ? true : requiresLocation;
+      const input = wrapper.querySelector(`[name="${key}"]`);
+      const value = input && 'value' in input ? input.value.trim() : '';
+      const isMissing = required && !value;
+      wrapper.classList.toggle('required', isMissing);
+      const hint = wrapper.querySelector('[data-required-hint]');
+      if (hint) {
+        hint.style.display = isMissing ? 'block' : 'none';
+      }
+    });
+  };
+
+  document.querySelectorAll('form').forEach((formEl) => {
+    const locationSelect = formEl.querySelector('select[name="location_type"]');
+    if (!locationSelect) return;
+    applyLocationRequirement(formEl, locationSelect.value);
+    locationSelect.addEventListener('change', () => {
+      applyLocationRequirement(formEl, locationSelect.value);
+    });
+    formEl.querySelectorAll('[data-required-field]').forEach((wrapper) => {
+      const key = wrapper.getAttribute('data-required-field');
+      if (!key) return;
+      const input = wrapper.querySelector(`[name="${key}"]`);
+      if (!input) return;
+      input.addEventListener('input', () => {
+        applyLocationRequirement(formEl, locationSelect.value);
+      });
+    });
+  });
+
+  const params = new URLSearchParams(window.location.search);
+  const focusId = params.get('focus');
+  if (focusId) {
+    const target = document.getElementById(`event-${focusId}`);
+    if (target) {
+      target.classList.add('focus');
+      target.scrollIntoView({ behavior: 'smooth', block: 'center' });
+    }
+  }
+
+  const eventDataScript = document.getElementById('event-data');
+  if (eventDataScript) {
+    let eventData = {};
+    try {
+      eventData = JSON.parse(eventDataScript.textContent || '{}');
+    } catch (error) {
+      eventData = {};
+    }
+    const detail = document.getElementById('event-detail');
+    if (detail) {
+      const form = detail.querySelector('form');
+      const titleEl = detail.querySelector('#event-title');
+      const confEl = detail.querySelector('#event-conf');
+      const missingEl = detail.querySelector('#event-missing');
+      const posterId = detail.getAttribute('data-poster-id') || '';
+      const panel = document.getElementById('event-panel');
+      const requiredFields = detail.querySelectorAll('[data-required-field]');
+      const isMobile = () => window.matchMedia('(max-width: 900px)').matches;
+      const setPanelOpen = (open) => {
+        if (!panel) return;
+        panel.dataset.open = open ? 'true' : 'false';
+        document.body.classList.toggle('panel-open', open);
+      };
+      const closePanel = () => {
+        setPanelOpen(false);
+        const url = new URL(window.location.href);
+        url.searchParams.delete('event');
+        history.replaceState({}, '', url.toString());
+      };
+
+      document.querySelectorAll('[data-event-close]').forEach((button) => {
+        button.addEventListener('click', () => {
+          closePanel();
+        });
+      });
+      window.addEventListener('resize', () => {
+        if (!isMobile()) {
+          setPanelOpen(false);
+        }
+      });
+
+      const titleCase = (value) => value ? value[0].toUpperCase() + value.slice(1) : value;
+      const renderMissing = (fields) => {
+        if (!fields || !fields.length) return '';
+        const chips = fields.map((field) => `<span class="chip warn">${titleCase(field)}</span>`).join('');
+        return `<div class="missing-summary"><span class="filter-label">Missing</span>${chips}</div>`;
+      };
+      const confidenceClass = (value) => {
+        if (value >= 0.8) return 'status-good';
+        if (value >= 0.6) return 'status-warn';
+        return 'status-bad';
+      };
+      const renderConfidence = (value) => {
+        if (value === null || value === undefined || Number.isNaN(value)) return '';
+        const label = `${Math.round(value * 100)}%`;
+        const klass = confidenceClass(value);
+        return `<span class="pill ${klass}">conf ${label}</span>`;
+      };
+      const setActiveCard = (eventId) => {
+        document.querySelectorAll('.event-card.active').forEach((card) => {
+          card.classList.remove('active');
+        });
+        const card = document.getElementById(`event-${eventId}`);
+        if (card) {
+          card.classList.add('active');
+        }
+      };
+      const setRequiredState = (wrapper, required) => {
+        const key = wrapper.getAttribute('data-required-field');
+        if (!key) return;
+        const input = wrapper.querySelector(`[name="${key}"]`);
+        const value = input && 'value' in input ? input.value.trim() : '';
+        const isMissing = required && !value;
+        wrapper.classList.toggle('required', isMissing);
+        const hint = wrapper.querySelector('[data-required-hint]');
+        if (hint) {
+          hint.style.display = isMissing ? 'block' : 'none';
+        }
+      };
+      const applyLocationRequirement = (locationType) => {
+        const normalized = (locationType || 'public').toLowerCase();
+        const requiresLocation = normalized !== 'internal' && normalized !== 'private';
+        requiredFields.forEach((wrapper) => {
+          const scope = wrapper.getAttribute('data-required-scope') || 'always';
+          const required = scope === 'always' ? true : requiresLocation;
+          setRequiredState(wrapper, required);
+        });
+        if (missingEl) {
+          if (!requiresLocation) {
+            missingEl.innerHTML = '<div class="missing-summary"><span class="pill soft">Internal event</span></div>';
+          } else {
+            const fields = ['venue', 'city', 'province'];
+            const missingFields = fields.filter((field) => {
+              const input = form && form.querySelector(`[name="${field}"]`);
+              return !input || !input.value.trim();
+            });
+            missingEl.innerHTML = renderMissing(missingFields);
+          }
+        }
+      };
+
+      const selectEvent = (eventId, options = {}) => {
+        const data = eventData[eventId];
+        if (!data || !form) return;
+        const { skipUrl = false, open = true, scroll = false } = options;
+
+        detail.classList.remove('empty');
+        detail.dataset.selectedEvent = eventId;
+        if (titleEl) {
+          titleEl.textContent = data.event_name || data.venue || 'Untitled event';
+        }
+        if (confEl) {
+          confEl.innerHTML = renderConfidence(data.confidence);
+        }
+        if (missingEl) {
+          missingEl.innerHTML = renderMissing(data.missing_fields);
+        }
+        form.setAttribute('action', `/event/${eventId}`);
+        const returnInput = form.querySelector('input[name="return"]');
+        if (returnInput && posterId) {
+          returnInput.value = `/poster/${posterId}?event=${eventId}`;
+        }
+        const fields = ['date', 'event_name', 'location_type', 'venue', 'city', 'province', 'time', 'ticket_info', 'status'];
+        fields.forEach((field) => {
+          const input = form.querySelector(`[name="${field}"]`);
+          if (!input) return;
+          if (field === 'status') {
+            input.value = data.status || 'active';
+          } else if (field === 'location_type') {
+            input.value = data.location_type || 'public';
+          } else {
+            input.value = data[field] || '';
+          }
+        });
+        applyLocationRequirement(data.location_type);
+        setActiveCard(eventId);
+        if (scroll) {
+          const card = document.getElementById(`event-${eventId}`);
+          if (card) {
+            card.scrollIntoView({ behavior: 'smooth', block: 'center' });
+          }
+        }
+        if (!skipUrl) {
+          const url = new URL(window.location.href);
+          url.searchParams.set('event', eventId);
+          history.replaceState({}, '', url.toString());
+        }
+        if (open && isMobile()) {
+          setPanelOpen(true);
+        }
+      };
+
+      document.querySelectorAll('[data-event-select]').forEach((button) => {
+        button.addEventListener('click', (event) => {
+          event.preventDefault();
+          const eventId = button.getAttribute('data-event-select');
+          if (eventId) {
+            selectEvent(eventId);
+          }
+        });
+      });
+
+      document.querySelectorAll('.event-card').forEach((card) => {
+        card.addEventListener('click', (event) => {
+          if (event.target.closest('a, button, input, select, textarea, label')) return;
+          const eventId = card.getAttribute('data-event-id');
+          if (eventId) {
+            selectEvent(eventId);
+          }
+        });
+      });
+
+      const locationSelect = detail.querySelector('select[name="location_type"]');
+      if (locationSelect) {
+        locationSelect.addEventListener('change', () => {
+          applyLocationRequirement(locationSelect.value);
+        });
+        applyLocationRequirement(locationSelect.value);
+      }
+      requiredFields.forEach((wrapper) => {
+        const key = wrapper.getAttribute('data-required-field');
+        if (!key) return;
+        const input = wrapper.querySelector(`[name="${key}"]`);
+        if (!input) return;
+        input.addEventListener('input', () => {
+          const locationValue = locationSelect ? locationSelect.value : 'public';
+          applyLocationRequirement(locationValue);
+        });
+      });
+
+      const initialParam = params.get('event');
+      const initialId = initialParam || detail.getAttribute('data-selected-event') || Object.keys(eventData)[0];
+      if (initialId) {
+        selectEvent(initialId, {
+          skipUrl: true,
+          open: Boolean(initialParam),
+          scroll: Boolean(initialParam),
+        });
+      }
+    }
+  }
+});
@@ -210,6 +210,22 @@ _THAI_PROVINCES = {
 
 _RAW_EVENT_KEYS = {"raw_text", "date_text", "time_text"}
 
+_MONTH_NAME_PATTERNS = tuple(
+    (re.compile(rf"\b{re.escape(name)}\b"), month) for name, month in _MONTHS.items()
+)
+_YEAR_RE = re.compile(r"(20\d{2})")
+_SOURCE_MONTH_SEP_RE = re.compile(r"^(\d{4})[-_/](\d{1,2})$")
+_SOURCE_MONTH_COMPACT_RE = re.compile(r"^(\d{4})(\d{2})$")
+_TIME_HM_RE = re.compile(r"(\d{1,2})[:\.](\d{2})")
+_TIME_HOUR_RE = re.compile(r"\b(\d{1,2})\b")
+_DATE_YMD_RE = re.compile(r"^(\d{4})[-/\.](\d{1,2})[-/\.](\d{1,2})$")
+_DATE_DMY_RE = re.compile(r"^(\d{1,2})[-/\.](\d{1,2})[-/\.](\d{2,4})$")
+_DATE_DM_RE = re.compile(r"^(\d{1,2})[-/\.](\d{1,2})$")
+_DATE_DAY_MONTH_NAME_RE = re.compile(r"^(\d{1,2})\s*([A-Za-z]+)\s*,?\s*(\d{4})?$")
+_DATE_MONTH_NAME_DAY_RE = re.compile(r"^([A-Za-z]+)\s*(\d{1,2})\s*,?\s*(\d{4})?$")
+_DATE_DAY_RE = re.compile(r"^(\d{1,2})$")
+_CODE_FENCE_RE = re.compile(r"```(?:json)?", re.IGNORECASE)
+
 
 def _strip_raw_fields(data: dict) -> dict:
     cleaned = {key: value for key, value in data.items() if not key.endswith("_raw")}
@@ -255,7 +271,7 @@ def _normalize_location_fields(event: dict) -> None:
 
 
 def _extract_year(text: str) -> Optional[int]:
-    match = re.search(r"(20\d{2})", text)
+    match = _YEAR_RE.search(text)
     if match:
         return int(match.group(1))
     return None
@@ -263,8 +279,8 @@ def _extract_year(text: str) -> Optional[int]:
 
 def _extract_month(text: str) -> Optional[int]:
     lowered = text.lower()
-    for name, month in _MONTHS.items():
-        if re.search(rf"\b{re.escape(name)}\b", lowered):
+    for pattern, month in _MONTH_NAME_PATTERNS:
+        if pattern.search(lowered):
             return month
     return None
 
@@ -276,12 +292,12 @@ def _normalize_source_month(value: Optional[str]) -> Optional[str]:
     if not text:
         return None
 
-    match = re.match(r"^(\d{4})[-_/](\d{1,2})$", text)
+    match = _SOURCE_MONTH_SEP_RE.match(text)
     if match:
         year, month = match.groups()
         return f"{int(year):04d}-{int(month):02d}"
 
-    match = re.match(r"^(\d{4})(\d{2})$", text)
+    match = _SOURCE_MONTH_COMPACT_RE.match(text)
     if match:
         year, month = match.groups()
         return f"{int(year):04d}-{int(month):02d}"
@@ -315,7 +331,7 @@ def _normalize_time(value: Optional[str]) -> Optional[str]:
     if not text:
         return None
 
-    match = re.search(r"(\d{1,2})[:\.](\d{2})", text)
+    match = _TIME_HM_RE.search(text)
     if match:
         hour = int(match.group(1))
         minute = int(match.group(2))
@@ -326,7 +342,7 @@ def _normalize_time(value: Optional[str]) -> Optional[str]:
         if 0 <= hour <= 23 and 0 <= minute <= 59:
             return f"{hour:02d}:{minute:02d}"
 
-    match = re.search(r"\b(\d{1,2})\b", text)
+    match = _TIME_HOUR_RE.search(text)
     if match:
         hour = int(match.group(1))
         if "pm" in text and hour < 12:
@@ -346,12 +362,12 @@ def _normalize_date(value: Optional[str], source_month: Optional[str]) -> Option
     if not text:
         return None
 
-    match = re.match(r"^(\d{4})[-/\.](\d{1,2})[-/\.](\d{1,2})$", text)
+    match = _DATE_YMD_RE.match(text)
     if match:
         year, month, day = map(int, match.groups())
         return f"{year:04d}-{month:02d}-{day:02d}"
 
-    match = re.match(r"^(\d{1,2})[-/\.](\d{1,2})[-/\.](\d{2,4})$", text)
+    match = _DATE_DMY_RE.match(text)
     if match:
         day, month, year = match.groups()
         year = int(year)
@@ -359,7 +375,7 @@ def _normalize_date(value: Optional[str], source_month: Optional[str]) -> Option
             year += 2000
         return f"{year:04d}-{int(month):02d}-{int(day):02d}"
 
-    match = re.match(r"^(\d{1,2})[-/\.](\d{1,2})$", text)
+    match = _DATE_DM_RE.match(text)
     if match:
         day, month = map(int, match.groups())
         year = None
@@ -368,7 +384,7 @@ def _normalize_date(value: Optional[str], source_month: Optional[str]) -> Option
         if year:
             return f"{year:04d}-{month:02d}-{day:02d}"
 
-    match = re.match(r"^(\d{1,2})\s*([A-Za-z]+)\s*,?\s*(\d{4})?$", text)
+    match = _DATE_DAY_MONTH_NAME_RE.match(text)
     if match:
         day = int(match.group(1))
         month = _MONTHS.get(match.group(2).lower())
@@ -380,7 +396,7 @@ def _normalize_date(value: Optional[str], source_month: Optional[str]) -> Option
                 year = int(source_month.split("-")[0])
                 return f"{year:04d}-{month:02d}-{day:02d}"
 
-    match = re.match(r"^([A-Za-z]+)\s*(\d{1,2})\s*,?\s*(\d{4})?$", text)
+    match = _DATE_MONTH_NAME_DAY_RE.match(text)
     if match:
         month = _MONTHS.get(match.group(1).lower())
         day = int(match.group(2))
@@ -392,7 +408,7 @@ def _normalize_date(value: Optional[str], source_month: Optional[str]) -> Option
                 year = int(source_month.split("-")[0])
                 return f"{year:04d}-{month:02d}-{day:02d}"
 
-    match = re.match(r"^(\d{1,2})$", text)
+    match = _DATE_DAY_RE.match(text)
     if match and source_month:
         day = int(match.group(1))
         year, month = source_month.split("-")
@@ -552,7 +568,7 @@ def _generate_with_instruction(contents: list, system_instruction: str) -> objec
 def _strip_code_fences(text: str) -> str:
     if "```" not in text:
         return text
-    cleaned = re.sub(r"```(?:json)?", "", text, flags=re.IGNORECASE)
+    cleaned = _CODE_FENCE_RE.sub("", text)
     return cleaned.replace("```", "").strip()
 
 
@@ -3,7 +3,12 @@ import sqlite3
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec.
+    orjson = None
 
 
 SCHEMA_PATH = Path(__file__).resolve().parent.parent / "database" / "schema_local.sql"
@@ -13,11 +18,31 @@ def _now() -> str:
     return datetime.utcnow().isoformat(timespec="seconds") + "Z"
 
 
+def json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(raw: Union[str, bytes]) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def init_db(db_path: Path) -> sqlite3.Connection:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(str(db_path))
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
     conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
     _ensure_columns(conn)
     return conn
@@ -30,10 +55,11 @@ def _column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
 
 def _ensure_column(
     conn: sqlite3.Connection, table: str, column: str, ddl: str
-) -> None:
+) -> bool:
     if _column_exists(conn, table, column):
-        return
+        return False
     conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}")
+    return True
 
 
 def _ensure_columns(conn: sqlite3.Connection) -> None:
@@ -42,6 +68,34 @@ def _ensure_columns(conn: sqlite3.Connection) -> None:
     _ensure_column(conn, "posters", "image_hash", "TEXT")
     _ensure_column(conn, "events", "confidence", "REAL")
     _ensure_column(conn, "events", "location_type", "TEXT DEFAULT 'public'")
+    added_counts = [
+        _ensure_column(conn, "posters", column, "INTEGER NOT NULL DEFAULT 0")
+        for column in ("event_count", "pending_count", "approved_count", "rejected_count")
+    ]
+    if any(added_counts):
+        _backfill_event_counts(conn)
+
+
+def _backfill_event_counts(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        UPDATE posters SET
+            event_count = (SELECT COUNT(*) FROM events e WHERE e.poster_id = posters.id),
+            pending_count = (
+                SELECT COUNT(*) FROM events e
+                WHERE e.poster_id = posters.id AND e.review_status = 'pending'
+            ),
+            approved_count = (
+                SELECT COUNT(*) FROM events e
+                WHERE e.poster_id = posters.id AND e.review_status = 'approved'
+            ),
+            rejected_count = (
+                SELECT COUNT(*) FROM events e
+                WHERE e.poster_id = posters.id AND e.review_status = 'rejected'
+            )
+        """
+    )
+    conn.commit()
 
 
 def _build_image_url(data: Dict[str, Any], fallback: str) -> str:
@@ -111,9 +165,10 @@ def _insert_poster(
         version = row["version"] or 1
         if version + 1 > next_version:
             next_version = version + 1
-        conn.execute(
+    if latest_rows:
+        conn.executemany(
             "UPDATE posters SET is_latest = 0 WHERE id = ?",
-            (row["id"],),
+            [(row["id"],) for row in latest_rows],
         )
 
     poster_id = str(uuid.uuid4())
@@ -139,7 +194,7 @@ def _insert_poster(
             poster_confidence,
             next_version,
             1,
-            json.dumps(raw_json, ensure_ascii=False),
+            json_dumps(raw_json).decode("utf-8"),
             "success",
             _now(),
             _now(),
@@ -153,13 +208,33 @@ def _insert_events(
     poster_id: str,
     events: List[Dict[str, Any]],
 ) -> int:
-    count = 0
-    for event in events:
-        if not event.get("date"):
-            continue
-        event_id = str(uuid.uuid4())
-        location_type = event.get("location_type") or "public"
-        conn.execute(
+    now = _now()
+    rows = [
+        (
+            str(uuid.uuid4()),
+            poster_id,
+            event.get("date"),
+            event.get("date_text"),
+            event.get("event_name"),
+            event.get("venue"),
+            event.get("city"),
+            event.get("province"),
+            event.get("country") or "Thailand",
+            event.get("location_type") or "public",
+            event.get("time"),
+            event.get("time_text"),
+            event.get("ticket_info"),
+            event.get("status") or "active",
+            event.get("review_status") or "pending",
+            event.get("confidence"),
+            now,
+            now,
+        )
+        for event in events
+        if event.get("date")
+    ]
+    if rows:
+        conn.executemany(
             """
             INSERT INTO events (
                 id, poster_id, date, date_text, event_name, venue, city, province,
@@ -168,29 +243,9 @@ def _insert_events(
             )
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            (
-                event_id,
-                poster_id,
-                event.get("date"),
-                event.get("date_text"),
-                event.get("event_name"),
-                event.get("venue"),
-                event.get("city"),
-                event.get("province"),
-                event.get("country") or "Thailand",
-                location_type,
-                event.get("time"),
-                event.get("time_text"),
-                event.get("ticket_info"),
-                event.get("status") or "active",
-                event.get("review_status") or "pending",
-                event.get("confidence"),
-                _now(),
-                _now(),
-            ),
+            rows,
         )
-        count += 1
-    return count
+    return len(rows)
 
 
 def ingest_structured(
@@ -199,6 +254,7 @@ def ingest_structured(
     image_url: Optional[str] = None,
     source_type: str = "manual",
     source_url: Optional[str] = None,
+    conn: Optional[sqlite3.Connection] = None,
 ) -> Dict[str, Any]:
     artist_name = data.get("artist_name")
     if not artist_name:
@@ -214,8 +270,13 @@ def ingest_structured(
 
     image_url_value = image_url or _build_image_url(data, fallback="unknown")
 
-    conn = init_db(db_path)
+    owns_conn = conn is None
+    if conn is None:
+        conn = init_db(db_path)
     try:
+        # Take the write lock up front so the artist lookup cannot race another writer.
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
         artist_id = _get_artist_id(
             conn, artist_name, instagram_handle, contact_info
         )
@@ -234,8 +295,12 @@ def ingest_structured(
         )
         event_count = _insert_events(conn, poster_id, data.get("events") or [])
         conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
     finally:
-        conn.close()
+        if owns_conn:
+            conn.close()
 
     return {
         "artist_id": artist_id,
@@ -243,3 +308,42 @@ def ingest_structured(
         "event_count": event_count,
         "source_month": source_month,
     }
+
+
+def find_ingest(
+    conn: sqlite3.Connection, path: str, content_hash: str
+) -> Optional[Dict[str, Any]]:
+    row = conn.execute(
+        """
+        SELECT l.summary_json
+        FROM ingest_log l
+        JOIN posters p ON p.id = l.poster_id
+        WHERE l.path = ? AND l.content_hash = ?
+        """,
+        (path, content_hash),
+    ).fetchone()
+    if not row:
+        return None
+    return json_loads(row["summary_json"])
+
+
+def record_ingest(
+    conn: sqlite3.Connection,
+    path: str,
+    content_hash: str,
+    summary: Dict[str, Any],
+) -> None:
+    conn.execute(
+        """
+        INSERT OR REPLACE INTO ingest_log (path, content_hash, poster_id, summary_json, ingested_at)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        (
+            path,
+            content_hash,
+            summary["poster_id"],
+            json_dumps(summary).decode("utf-8"),
+            _now(),
+        ),
+    )
+    conn.commit()